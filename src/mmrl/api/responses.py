@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+class OrjsonResponse(ORJSONResponse):
+    """
+    orjson-backed JSON response.
+
+    Encodes UTC datetimes with a trailing "Z" so payloads match what the
+    Pydantic response models produce for the same fields.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+        )
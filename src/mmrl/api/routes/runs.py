@@ -1,31 +1,137 @@
 from __future__ import annotations
 
-from datetime import datetime
-from threading import Lock
+import asyncio
+import os
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import TypedDict
+from weakref import WeakValueDictionary
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
+from mmrl.api.responses import OrjsonResponse
 from mmrl.core.config.settings import settings
-from mmrl.core.run.artifacts import artifacts_for
+from mmrl.core.run.artifacts import RunArtifacts, artifacts_for
 from mmrl.core.run.factory import RunFactory
 from mmrl.core.run.manager import RunManager
-from mmrl.core.run.registry import RunRegistry, RunStatus
+from mmrl.core.run.registry import RunRecord, RunRegistry, RunStatus
 from mmrl.core.run.spec import RunSpec
 
 router = APIRouter(tags=["runs"])
 
-# Minimal singleton for now (works in single-process dev).
+# Minimal singletons for now (works in single-process dev).
 _registry = RunRegistry()
 
-# Live handles in this process only (dev-mode)
-_live_lock = Lock()
+# Settings are a process-wide constant; snapshot them once instead of per POST.
+# Treated as read-only by RunManager (it only serializes it).
+_SETTINGS_SNAPSHOT = settings.model_dump()
+
+# Live handles in this process only (dev-mode).
+# Reads are lock-free (single dict lookups are atomic); building a handle is
+# serialized per run_id so starts on distinct runs never contend.
 _live: dict[str, "RunHandle"] = {}
+# Build locks live only while some request holds them (no unbounded growth)
+_run_locks: WeakValueDictionary[str, asyncio.Lock] = WeakValueDictionary()
 
 # Import type only (avoid circulars)
 from mmrl.core.run.assembly import RunHandle  # noqa: E402  (safe in runtime too)
 
 
+# =========================
+# Artifact path cache
+# =========================
+
+# (runs_dir, run_id) -> RunArtifacts. Artifact paths are a pure function of the
+# key; an entry is dropped when its run is marked as errored.
+_ARTIFACTS: dict[tuple[Path, str], RunArtifacts] = {}
+_ARTIFACTS_MAX = 4096
+
+
+def _artifacts_cached(run_id: str) -> RunArtifacts:
+    """
+    Resolve artifact paths once per (current runs_dir, run_id).
+    """
+    key = (settings.runs_dir, run_id)
+    art = _ARTIFACTS.get(key)
+    if art is None:
+        art = artifacts_for(runs_dir=key[0], run_id=run_id)
+        if len(_ARTIFACTS) >= _ARTIFACTS_MAX:
+            # Evict oldest insertion
+            _ARTIFACTS.pop(next(iter(_ARTIFACTS)), None)
+        _ARTIFACTS[key] = art
+    return art
+
+
+def _mark_error(run_id: str, e: Exception) -> None:
+    _registry.mark_error(run_id=run_id, error_type=type(e).__name__, error_message=str(e))
+    # The failure may have been the run directory itself; resolve afresh next time
+    _ARTIFACTS.pop((settings.runs_dir, run_id), None)
+
+
+@lru_cache(maxsize=4)
+def _manager_for(runs_dir: Path) -> RunManager:
+    """
+    One RunManager per runs_dir, built on first use from the current settings.
+    """
+    return RunManager(runs_dir)
+
+
+@lru_cache(maxsize=4)
+def _factory_for(runs_dir: Path) -> RunFactory:
+    return RunFactory(runs_dir=runs_dir)
+
+
+@lru_cache(maxsize=4)
+def _runs_dir_str(runs_dir: Path) -> str:
+    return str(runs_dir.resolve())
+
+
+@lru_cache(maxsize=4096)
+def _artifact_strs(run_dir: str) -> dict[str, str]:
+    """
+    Stringified artifact paths as exposed by the API (built once per run_dir).
+
+    Callers must treat the returned dict as read-only (it is shared).
+    """
+    return RunArtifacts.str_paths(run_dir)
+
+
+def _disk_created_at(run_dir: str) -> datetime:
+    """
+    Creation time for runs the registry does not know about (directory mtime).
+
+    Stats on every call, so a deleted run directory raises FileNotFoundError;
+    only the datetime built from the mtime is memoized.
+    """
+    return _mtime_datetime(os.stat(run_dir).st_mtime_ns)
+
+
+@lru_cache(maxsize=4096)
+def _mtime_datetime(mtime_ns: int) -> datetime:
+    return datetime.fromtimestamp(mtime_ns / 1e9, tz=timezone.utc)
+
+
+def _touch_artifacts(art: RunArtifacts) -> None:
+    art.ensure_dirs()
+    art.events_jsonl.touch(exist_ok=True)
+
+
+async def _ensure_run_exists(run_id: str) -> RunRecord | None:
+    """
+    Resolve a run for state-changing routes (404 if unknown).
+
+    Known runs are answered from the registry without touching the filesystem;
+    the directory probe only happens when the registry has no record
+    (e.g. runs created by a previous process), and runs in the default executor.
+    """
+    rec = _registry.get(run_id=run_id)
+    if rec is None and not await asyncio.to_thread(_artifacts_cached(run_id).run_dir.exists):
+        raise HTTPException(status_code=404, detail="run not found")
+    return rec
+
+
 # =========================
 # Schemas
 # =========================
@@ -64,166 +170,246 @@ class RunsListResponse(BaseModel):
     runs: list[RunDetailsResponse]
 
 
+# Upper bound on run_ids per batchGet call (keeps a single request bounded)
+_BATCH_GET_MAX = 100
+
+
+class BatchGetRunsRequest(BaseModel):
+    run_ids: list[str] = Field(..., min_length=1, max_length=_BATCH_GET_MAX)
+
+
+class BatchGetRunResult(BaseModel):
+    """
+    Per-item result: ok=True -> data is set, ok=False -> error is set.
+    """
+    run_id: str
+    ok: bool
+    data: RunDetailsResponse | None = None
+    error: str | None = None
+
+
+class BatchGetRunsResponse(BaseModel):
+    results: list[BatchGetRunResult]
+
+
+# Output-side mirrors of the response models above. Handlers that serve trusted,
+# internally-built data return these (encoded by orjson) and keep the BaseModel
+# only as response_model for the OpenAPI schema, so nothing is re-validated.
+
+class RunDetailsDict(TypedDict):
+    run_id: str
+    status: RunStatus
+    created_at_utc: datetime
+    updated_at_utc: datetime
+    run_dir: str
+    artifacts: dict[str, str]
+    error_type: str | None
+    error_message: str | None
+
+
+class BatchGetRunResultDict(TypedDict):
+    run_id: str
+    ok: bool
+    data: RunDetailsDict | None
+    error: str | None
+
+
+# =========================
+# Helpers
+# =========================
+
+def _run_details(
+    *,
+    run_id: str,
+    status: RunStatus,
+    created_at_utc: datetime,
+    updated_at_utc: datetime,
+    run_dir: str,
+    error_type: str | None = None,
+    error_message: str | None = None,
+) -> RunDetailsDict:
+    return {
+        "run_id": run_id,
+        "status": status,
+        "created_at_utc": created_at_utc,
+        "updated_at_utc": updated_at_utc,
+        "run_dir": run_dir,
+        "artifacts": _artifact_strs(run_dir),
+        "error_type": error_type,
+        "error_message": error_message,
+    }
+
+
+async def _build_run_details(run_id: str) -> RunDetailsDict:
+    """
+    Shared by get_run and batch_get_runs. Raises HTTPException(404) for unknown runs.
+    """
+    rec = _registry.get(run_id=run_id)
+    run_dir = str(_artifacts_cached(run_id).run_dir)
+
+    if rec is None:
+        # Registry miss (e.g. run created by another process): fall back to disk
+        try:
+            created = await asyncio.to_thread(_disk_created_at, run_dir)
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="run not found")
+        return _run_details(
+            run_id=run_id,
+            status="created",
+            created_at_utc=created,
+            updated_at_utc=created,
+            run_dir=run_dir,
+        )
+
+    return _run_details(
+        run_id=run_id,
+        status=rec.status,
+        created_at_utc=rec.created_at_utc,
+        updated_at_utc=rec.updated_at_utc,
+        run_dir=run_dir,
+        error_type=rec.error_type,
+        error_message=rec.error_message,
+    )
+
+
 # =========================
 # Routes
 # =========================
 
 @router.post("/runs", response_model=CreateRunResponse)
-def create_run(payload: CreateRunRequest) -> CreateRunResponse:
+async def create_run(payload: CreateRunRequest) -> CreateRunResponse:
     seed = payload.seed if payload.seed is not None else settings.default_seed
 
-    manager = RunManager(settings.runs_dir)
-    run = manager.create_run(seed=seed, config_snapshot=settings.model_dump())
+    # Filesystem work runs in the default executor so the event loop stays responsive
+    manager = _manager_for(settings.runs_dir)
+    run = await asyncio.to_thread(manager.create_run, seed=seed, config_snapshot=_SETTINGS_SNAPSHOT)
 
     _registry.upsert_created(run)
 
     # Ensure artifacts exist (idempotent)
-    art = artifacts_for(runs_dir=settings.runs_dir, run_id=run.run_id)
-    art.ensure_dirs()
-    art.events_jsonl.touch(exist_ok=True)
+    art = _artifacts_cached(run.run_id)
+    await asyncio.to_thread(_touch_artifacts, art)
 
     # Persist RunSpec as canonical config.json
-    factory = RunFactory(runs_dir=settings.runs_dir)
-
     if payload.run_spec is None:
-        # Default spec, but seed should reflect what the run was created with
-        spec = RunSpec(seed=seed)
+        # Default spec, but seed should reflect what the run was created with.
+        # Built from known-good defaults, so skip validation.
+        spec = RunSpec.model_construct(seed=seed)
     else:
         # Respect caller, but keep seed aligned unless explicitly set
         spec = payload.run_spec
         if spec.seed is None:
             spec.seed = seed  # pydantic model is mutable by default
 
-    factory.save_spec(run_id=run.run_id, spec=spec)
+    await asyncio.to_thread(_factory_for(settings.runs_dir).save_spec, run_id=run.run_id, spec=spec)
 
     return CreateRunResponse(run_id=run.run_id)
 
 
 @router.post("/runs/{run_id}/start", response_model=StartRunResponse)
-def start_run(run_id: str) -> StartRunResponse:
-    art = artifacts_for(runs_dir=settings.runs_dir, run_id=run_id)
-    if not art.run_dir.exists():
-        raise HTTPException(status_code=404, detail="run not found")
-
-    factory = RunFactory(runs_dir=settings.runs_dir)
-
-    with _live_lock:
-        handle = _live.get(run_id)
-        if handle is None:
-            try:
-                spec = factory.load_spec(run_id=run_id)
-            except Exception as e:
-                _registry.mark_error(run_id=run_id, error_type=type(e).__name__, error_message=str(e))
-                raise HTTPException(status_code=409, detail=f"failed to load RunSpec: {e}")
+async def start_run(run_id: str) -> StartRunResponse:
+    await _ensure_run_exists(run_id)
 
-            try:
-                handle = factory.build(run_id=run_id, spec=spec)
-            except Exception as e:
-                _registry.mark_error(run_id=run_id, error_type=type(e).__name__, error_message=str(e))
-                raise HTTPException(status_code=409, detail=f"failed to build run: {e}")
-
-            _live[run_id] = handle
+    handle = _live.get(run_id)
+    if handle is None:
+        # Keep a strong ref for the duration of the build
+        lock = _run_locks.setdefault(run_id, asyncio.Lock())
+        async with lock:
+            # Re-check: a concurrent start may have built it while we waited
+            handle = _live.get(run_id)
+            if handle is None:
+                factory = _factory_for(settings.runs_dir)
+                try:
+                    spec = await asyncio.to_thread(factory.load_spec, run_id=run_id)
+                except Exception as e:
+                    _mark_error(run_id, e)
+                    raise HTTPException(status_code=409, detail=f"failed to load RunSpec: {e}")
+
+                try:
+                    handle = await asyncio.to_thread(factory.build, run_id=run_id, spec=spec)
+                except Exception as e:
+                    _mark_error(run_id, e)
+                    raise HTTPException(status_code=409, detail=f"failed to build run: {e}")
+
+                handle = _live.setdefault(run_id, handle)
 
     try:
-        handle.lifecycle.start()
+        # start() publishes RunStarted through the bus (event log I/O): keep it
+        # off the event loop like load/build above
+        await asyncio.to_thread(handle.lifecycle.start)
         _registry.mark_running(run_id=run_id)
         return StartRunResponse(run_id=run_id, status="running")
     except Exception as e:
-        _registry.mark_error(run_id=run_id, error_type=type(e).__name__, error_message=str(e))
+        _mark_error(run_id, e)
         # If start fails, don't keep a broken live handle around
-        with _live_lock:
-            _live.pop(run_id, None)
+        _live.pop(run_id, None)
         raise HTTPException(status_code=409, detail=str(e))
 
 
 @router.post("/runs/{run_id}/stop", response_model=StopRunResponse)
-def stop_run(run_id: str) -> StopRunResponse:
-    art = artifacts_for(runs_dir=settings.runs_dir, run_id=run_id)
-    if not art.run_dir.exists():
-        raise HTTPException(status_code=404, detail="run not found")
+async def stop_run(run_id: str) -> StopRunResponse:
+    await _ensure_run_exists(run_id)
 
-    with _live_lock:
-        handle = _live.get(run_id)
+    handle = _live.get(run_id)
 
     if handle is None:
         raise HTTPException(status_code=409, detail="run is not running in this process")
 
     try:
-        handle.lifecycle.stop()
+        # stop() publishes RunStopped, which flushes and fsyncs the event log
+        await asyncio.to_thread(handle.lifecycle.stop)
         _registry.mark_stopped(run_id=run_id)
 
         # remove handle so a future /start creates a fresh lifecycle
-        with _live_lock:
-            _live.pop(run_id, None)
+        _live.pop(run_id, None)
 
         return StopRunResponse(run_id=run_id, status="stopped")
     except Exception as e:
-        _registry.mark_error(run_id=run_id, error_type=type(e).__name__, error_message=str(e))
+        _mark_error(run_id, e)
         raise HTTPException(status_code=409, detail=str(e))
 
 
 @router.get("/runs", response_model=RunsListResponse)
-def list_runs() -> RunsListResponse:
-    out: list[RunDetailsResponse] = []
-    for rec in _registry.list():
-        art = artifacts_for(runs_dir=settings.runs_dir, run_id=rec.run_id)
-        out.append(
-            RunDetailsResponse(
-                run_id=rec.run_id,
-                status=rec.status,
-                created_at_utc=rec.created_at_utc,
-                updated_at_utc=rec.updated_at_utc,
-                run_dir=str(art.run_dir),
-                artifacts={
-                    "config_json": str(art.config_json),
-                    "meta_json": str(art.meta_json),
-                    "events_jsonl": str(art.events_jsonl),
-                    "metrics_json": str(art.metrics_json),
-                    "evaluation_json": str(art.evaluation_json),
-                    "engine_log": str(art.engine_log),
-                },
-                error_type=rec.error_type,
-                error_message=rec.error_message,
-            )
+async def list_runs() -> OrjsonResponse:
+    # Registry run_ids were validated on the way in, so paths are joined as
+    # plain strings against the resolved runs_dir (no per-row Path objects).
+    prefix = _runs_dir_str(settings.runs_dir) + os.sep
+    runs = [
+        _run_details(
+            run_id=rec.run_id,
+            status=rec.status,
+            created_at_utc=rec.created_at_utc,
+            updated_at_utc=rec.updated_at_utc,
+            run_dir=prefix + rec.run_id,
+            error_type=rec.error_type,
+            error_message=rec.error_message,
         )
-    return RunsListResponse(runs=out)
+        for rec in _registry.list()
+    ]
+    return OrjsonResponse(content={"runs": runs})
+
+
+@router.post("/runs:batchGet", response_model=BatchGetRunsResponse)
+async def batch_get_runs(payload: BatchGetRunsRequest) -> OrjsonResponse:
+    """
+    Fetch several runs in one round-trip.
+
+    Partial failures do not fail the batch: each item carries either
+    data or an error. Results preserve request order.
+    """
+    results: list[BatchGetRunResultDict] = []
+    for run_id in payload.run_ids:
+        try:
+            details = await _build_run_details(run_id)
+        except HTTPException as e:
+            results.append({"run_id": run_id, "ok": False, "data": None, "error": str(e.detail)})
+        except ValueError as e:
+            results.append({"run_id": run_id, "ok": False, "data": None, "error": str(e)})
+        else:
+            results.append({"run_id": run_id, "ok": True, "data": details, "error": None})
+    return OrjsonResponse(content={"results": results})
 
 
 @router.get("/runs/{run_id}", response_model=RunDetailsResponse)
-def get_run(run_id: str) -> RunDetailsResponse:
-    rec = _registry.get(run_id=run_id)
-    art = artifacts_for(runs_dir=settings.runs_dir, run_id=run_id)
-
-    if not art.run_dir.exists():
-        raise HTTPException(status_code=404, detail="run not found")
-
-    if rec is None:
-        created = datetime.fromtimestamp(art.run_dir.stat().st_mtime)
-        updated = created
-        status: RunStatus = "created"
-        error_type = None
-        error_message = None
-    else:
-        created = rec.created_at_utc
-        updated = rec.updated_at_utc
-        status = rec.status
-        error_type = rec.error_type
-        error_message = rec.error_message
-
-    return RunDetailsResponse(
-        run_id=run_id,
-        status=status,
-        created_at_utc=created,
-        updated_at_utc=updated,
-        run_dir=str(art.run_dir),
-        artifacts={
-            "config_json": str(art.config_json),
-            "meta_json": str(art.meta_json),
-            "events_jsonl": str(art.events_jsonl),
-            "metrics_json": str(art.metrics_json),
-            "evaluation_json": str(art.evaluation_json),
-            "engine_log": str(art.engine_log),
-        },
-        error_type=error_type,
-        error_message=error_message,
-    )
+async def get_run(run_id: str) -> OrjsonResponse:
+    return OrjsonResponse(content=await _build_run_details(run_id))
@@ -4,6 +4,7 @@ import structlog
 from fastapi import FastAPI
 
 from mmrl.api import router as api_router
+from mmrl.api.responses import OrjsonResponse
 from mmrl.core.config.settings import settings
 from mmrl.core.logging.setup import configure_logging
 
@@ -23,6 +24,8 @@ def create_app() -> FastAPI:
     app = FastAPI(
         title="MMRL Backend",
         version="0.1.0",
+        # orjson-backed encoding for every route (C-level datetime/dict encoding)
+        default_response_class=OrjsonResponse,
     )
 
     @app.on_event("startup")
@@ -20,6 +20,8 @@ class EngineLifecycle:
     def __init__(self, *, bus: EventBus, state: EngineState) -> None:
         self._bus = bus
         self._state = state
+        # run_id is fixed for the lifetime of the state; bind it once
+        self._log = log.bind(run_id=state.run_id, component="engine")
 
     @property
     def state(self) -> EngineState:
@@ -48,7 +50,7 @@ class EngineLifecycle:
             )
         )
 
-        log.info("engine.started", run_id=self._state.run_id)
+        self._log.info("engine.started")
 
     def stop(self) -> None:
         if not self._state.is_running:
@@ -67,4 +69,4 @@ class EngineLifecycle:
             )
         )
 
-        log.info("engine.stopped", run_id=self._state.run_id)
+        self._log.info("engine.stopped")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import Callable, Iterable, Protocol, Sequence
 
@@ -9,6 +10,9 @@ from mmrl.core.events.bus import EventBus, Subscription
 
 EventHandler = Callable[[Event], None]
 
+# Component class -> interned class name (wiring labels, shared across routers)
+_NAME_CACHE: dict[type, str] = {}
+
 
 class EventComponent(Protocol):
     """
@@ -56,7 +60,11 @@ class EngineRouter:
 
     @staticmethod
     def _component_name(component: object) -> str:
-        return type(component).__name__
+        cls = type(component)
+        name = _NAME_CACHE.get(cls)
+        if name is None:
+            name = _NAME_CACHE.setdefault(cls, sys.intern(cls.__name__))
+        return name
 
     def register(self, components: Iterable[EventComponent]) -> RouterWiring:
         wired: list[WiredSubscription] = []
@@ -79,7 +87,8 @@ class EngineRouter:
                     raise RuntimeError(f"duplicate subscription detected: component={cname} event_type={event_type}")
                 seen.add(key)
 
-                s = self._bus.subscribe(event_type=event_type, handler=handler)
+            # Validated as a whole; wire the component's subscriptions in one call
+            for s in self._bus.subscribe_many(subs):
                 wired.append(WiredSubscription(component=cname, subscription=s))
 
         return RouterWiring(subscriptions=tuple(wired))
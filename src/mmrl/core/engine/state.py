@@ -12,7 +12,7 @@ class EngineState:
     - sequence: monotonic sequence used for event ordering (replay correctness)
 
     Guardrails:
-      - next_tick / next_sequence only valid while engine is running
+      - next_tick / next_sequence / next_sequence_range / next_step only valid while engine is running
         (prevents "events after stop" bugs and makes lifecycle explicit)
     """
 
@@ -32,3 +32,29 @@ class EngineState:
             raise RuntimeError("cannot advance sequence when engine is not running")
         self.sequence += 1
         return self.sequence
+
+    def next_sequence_range(self, n: int) -> range:
+        """
+        Allocate n contiguous sequences in one call (batch publishers).
+
+        Equivalent to n next_sequence() calls; returns the allocated numbers.
+        """
+        if not self.is_running:
+            raise RuntimeError("cannot advance sequence when engine is not running")
+        if n < 0:
+            raise ValueError("n must be >= 0")
+        start = self.sequence + 1
+        self.sequence += n
+        return range(start, start + n)
+
+    def next_step(self) -> tuple[int, int]:
+        """
+        Advance tick and allocate its sequence in one call (engine tick loop).
+
+        Equivalent to (next_tick(), next_sequence()) with a single guard.
+        """
+        if not self.is_running:
+            raise RuntimeError("cannot advance tick when engine is not running")
+        self.tick += 1
+        self.sequence += 1
+        return self.tick, self.sequence
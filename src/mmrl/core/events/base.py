@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, fields
 from datetime import datetime, timezone
 from typing import Any, ClassVar
 from uuid import UUID, uuid4
 
+# Bound once: Event.create runs for every event on the hot path
+_now = datetime.now
+_UTC = timezone.utc
+
 
 @dataclass(frozen=True, slots=True)
 class Event:
@@ -34,6 +39,16 @@ class Event:
     # Event type name (static per subclass)
     event_type: ClassVar[str]
 
+    def __init_subclass__(cls) -> None:
+        # No super() call: slots=True rebuilds the class, which breaks the
+        # zero-arg super() cell (and object.__init_subclass__ is a no-op).
+        # Dotted names ("market.best_bid_ask") are not auto-interned by CPython.
+        # Interning them (the bus interns its keys too) lets dispatch lookups
+        # hit the pointer-equality fast path.
+        et = cls.__dict__.get("event_type")
+        if isinstance(et, str):
+            cls.event_type = sys.intern(et)
+
     @classmethod
     def create(cls, **kwargs) -> "Event":
         """
@@ -41,7 +56,7 @@ class Event:
         """
         return cls(
             event_id=uuid4(),
-            timestamp_utc=datetime.now(timezone.utc),
+            timestamp_utc=_now(_UTC),
             **kwargs,
         )
 
@@ -1,19 +1,20 @@
 from __future__ import annotations
 
-from collections import defaultdict
+import sys
 from dataclasses import dataclass
-from typing import Callable, DefaultDict, Iterable, TypeAlias
+from typing import Any, Callable, Iterable, Sequence, TypeAlias
 
 import structlog
 
 from mmrl.core.events.base import Event
+from mmrl.core.logging.setup import is_debug_enabled
 
 log = structlog.get_logger()
 
 EventHandler: TypeAlias = Callable[[Event], None]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Subscription:
     """
     Represents a subscription of a handler to a specific event_type.
@@ -28,30 +29,111 @@ class EventBus:
     Deterministic synchronous event bus.
 
     - publish(event) dispatches to handlers subscribed to event.event_type
+      (so a handler only ever receives its own event class; handlers keep
+      isinstance checks debug-only, under `if __debug__`)
     - dispatch order is subscription order
     - failures are fail-fast by default (raises)
     """
 
     def __init__(self) -> None:
-        self._handlers: DefaultDict[str, list[EventHandler]] = defaultdict(list)
+        # event_type (interned) -> frozen handler tuple, in subscription order.
+        # Rebuilt only at subscribe (wiring) time; publish just iterates it.
+        self._handlers: dict[str, tuple[EventHandler, ...]] = {}
+
+        # event_type -> specialized dispatch callable (see _compile_dispatch)
+        self._dispatch: dict[str, EventHandler] = {}
+
+        self._debug = is_debug_enabled(log)
 
     def subscribe(self, *, event_type: str, handler: EventHandler) -> Subscription:
         if not event_type:
             raise ValueError("event_type must be non-empty")
-        self._handlers[event_type].append(handler)
-        log.debug("bus.subscribed", event_type=event_type, handler=getattr(handler, "__name__", "handler"))
+        event_type = sys.intern(event_type)
+        handlers = self._handlers[event_type] = self._handlers.get(event_type, ()) + (handler,)
+        self._dispatch[event_type] = _compile_dispatch(handlers)
+        if self._debug:
+            log.debug("bus.subscribed", event_type=event_type, handler=getattr(handler, "__name__", "handler"))
         return Subscription(event_type=event_type, handler=handler)
 
+    def subscribe_many(self, pairs: Iterable[tuple[str, EventHandler]]) -> tuple[Subscription, ...]:
+        """
+        Bulk subscribe (event_type, handler) pairs, preserving their order.
+
+        Same semantics as calling subscribe() per pair, with one aggregated
+        debug record instead of one per subscription.
+        """
+        handlers = self._handlers
+        touched: set[str] = set()
+        out: list[Subscription] = []
+        for event_type, handler in pairs:
+            if not event_type:
+                raise ValueError("event_type must be non-empty")
+            event_type = sys.intern(event_type)
+            handlers[event_type] = handlers.get(event_type, ()) + (handler,)
+            touched.add(event_type)
+            out.append(Subscription(event_type=event_type, handler=handler))
+        for event_type in touched:
+            self._dispatch[event_type] = _compile_dispatch(handlers[event_type])
+        if self._debug:
+            log.debug("bus.subscribed_many", subscriptions=len(out))
+        return tuple(out)
+
     def publish(self, event: Event) -> None:
-        handlers = self._handlers.get(event.event_type, [])
-        log.debug(
-            "bus.publish",
-            event_type=event.event_type,
-            event_id=str(event.event_id),
-            handlers=len(handlers),
-        )
-        for handler in handlers:
-            handler(event)
-
-    def subscribers_for(self, event_type: str) -> Iterable[EventHandler]:
-        return tuple(self._handlers.get(event_type, []))
+        try:
+            dispatch = self._dispatch[event.event_type]
+        except KeyError:
+            return
+        if self._debug:
+            log.debug(
+                "bus.publish",
+                event_type=event.event_type,
+                event_id=str(event.event_id),
+                handlers=len(self._handlers[event.event_type]),
+            )
+        dispatch(event)
+
+    def publish_many(self, events: Sequence[Event]) -> None:
+        """
+        Dispatch a batch of already-sequenced events, in order.
+
+        Semantically identical to calling publish() for each event; the dispatch
+        callable is looked up once per run of consecutive same-type events.
+        """
+        if self._debug:
+            log.debug("bus.publish_many", events=len(events))
+
+        dispatch_get = self._dispatch.get
+        last_type: str | None = None
+        dispatch: EventHandler | None = None
+        for event in events:
+            event_type = event.event_type
+            if event_type != last_type:
+                dispatch = dispatch_get(event_type)
+                last_type = event_type
+            if dispatch is not None:
+                dispatch(event)
+
+    def subscribers_for(self, event_type: str) -> tuple[EventHandler, ...]:
+        # Stored tuples are immutable: hand them out directly (no copy)
+        return self._handlers.get(event_type, ())
+
+
+def _compile_dispatch(handlers: tuple[EventHandler, ...]) -> EventHandler:
+    """
+    Build a dispatch callable for a fixed handler tuple (runs at wiring time).
+
+    A single handler is dispatched to directly. For several, generate a
+    straight-line function that calls each handler in subscription order,
+    with handlers bound as default args (fast locals): no loop or iterator
+    per event.
+    """
+    if len(handlers) == 1:
+        return handlers[0]
+
+    params = ", ".join(f"_h{i}=_h{i}" for i in range(len(handlers)))
+    body = "".join(f"    _h{i}(e)\n" for i in range(len(handlers)))
+    src = f"def dispatch(e, {params}):\n{body}"
+
+    ns: dict[str, Any] = {f"_h{i}": h for i, h in enumerate(handlers)}
+    exec(compile(src, "<EventBus dispatch>", "exec"), ns)
+    return ns["dispatch"]
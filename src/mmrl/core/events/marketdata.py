@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import ClassVar, Literal
+from datetime import datetime, timezone
+from typing import ClassVar, Literal, Sequence
+from uuid import uuid4
 
 from mmrl.core.events.base import Event
 
@@ -44,6 +46,39 @@ class OrderBookLevelUpdate(Event):
 
     sequence: int
 
+    @classmethod
+    def create_many(
+        cls,
+        *,
+        symbol: str,
+        side: Side,
+        prices: Sequence[float],
+        sizes: Sequence[float],
+        first_sequence: int,
+    ) -> list["OrderBookLevelUpdate"]:
+        """
+        Create one update per (price, size) pair, in input order.
+
+        Sequences run contiguously from first_sequence. The batch shares a
+        single creation timestamp (it describes one book delta).
+        """
+        if len(prices) != len(sizes):
+            raise ValueError("prices and sizes must have the same length")
+
+        ts = datetime.now(timezone.utc)
+        return [
+            cls(
+                event_id=uuid4(),
+                timestamp_utc=ts,
+                symbol=symbol,
+                side=side,
+                price=price,
+                size=size,
+                sequence=seq,
+            )
+            for seq, price, size in zip(range(first_sequence, first_sequence + len(prices)), prices, sizes)
+        ]
+
 
 @dataclass(frozen=True, slots=True)
 class TradePrint(Event):
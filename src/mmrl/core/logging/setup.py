@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Mapping
 
 import orjson
@@ -17,14 +20,34 @@ def _json_serializer(obj: Any, default: Any) -> str:
     return orjson.dumps(obj, default=default).decode("utf-8")
 
 
+# Single queue for the process: structlog and stdlib records both reach it
+# through the root logger's QueueHandler, and one QueueListener thread writes
+# them to stdout in emission order. Created on first configure and kept across
+# reconfiguration.
+_queue_handler: QueueHandler | None = None
+_listener: QueueListener | None = None
+
+
 def configure_logging(*, level: str = "INFO") -> None:
     """
     Configure structured logging for the entire application.
 
     This must be called exactly once at process startup.
+
+    Records are rendered on the calling thread; the write to stdout happens
+    on a QueueListener thread, so callers only pay for an enqueue.
     """
+    global _queue_handler, _listener
     log_level = getattr(logging, level.upper(), logging.INFO)
 
+    if _listener is None:
+        q: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        stream = logging.StreamHandler(sys.stdout)
+        stream.setFormatter(logging.Formatter("%(message)s"))
+        _queue_handler = QueueHandler(q)
+        _listener = QueueListener(q, stream)
+        _listener.start()
+
     processors: list[Any] = [
         # Merge context variables (run_id, component, symbol, etc.)
         structlog.contextvars.merge_contextvars,
@@ -42,20 +65,57 @@ def configure_logging(*, level: str = "INFO") -> None:
         structlog.processors.JSONRenderer(serializer=_json_serializer),
     ]
 
+    # Rendered lines go to stdlib loggers, so cached structlog loggers keep
+    # writing through the root handlers after a reconfigure
     structlog.configure(
         processors=processors,
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(file=sys.stdout),
+        logger_factory=structlog.stdlib.LoggerFactory(),
         wrapper_class=structlog.make_filtering_bound_logger(log_level),
         cache_logger_on_first_use=True,
     )
 
-    # Ensure stdlib logging flows through the same output
-    logging.basicConfig(
-        level=log_level,
-        format="%(message)s",
-        handlers=[logging.StreamHandler(sys.stdout)],
-    )
+    # Route stdlib logging (and the rendered structlog lines) through the queue,
+    # leaving handlers installed by the embedding app in place
+    root = logging.getLogger()
+    root.setLevel(log_level)
+    if _queue_handler not in root.handlers:
+        root.addHandler(_queue_handler)
+
+
+def _shutdown_output() -> None:
+    """
+    Drain queued records and stop the listener (idempotent; runs at exit).
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_shutdown_output)
+
+
+def is_debug_enabled(logger: Any) -> bool:
+    """
+    Whether `logger` currently emits DEBUG records (see is_level_enabled).
+    """
+    return is_level_enabled(logger, logging.DEBUG)
+
+
+def is_level_enabled(logger: Any, level: int) -> bool:
+    """
+    Whether `logger` currently emits records at `level` (stdlib level number).
+
+    Hot-path components store the result as a flag at construction and skip
+    building log kwargs entirely when the level is filtered out. The flag is
+    a snapshot: evaluate it after configure_logging(), not at import time. A
+    later configure_logging() does not refresh it for objects already built.
+    """
+    is_enabled_for = getattr(logger, "is_enabled_for", None)
+    if is_enabled_for is None:
+        return True
+    return bool(is_enabled_for(level))
 
 
 def bind_context(**values: Mapping[str, Any]) -> None:
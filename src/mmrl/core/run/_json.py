@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+import orjson
+
+# Canonical on-disk JSON for run artifacts (config.json, meta.json):
+# sorted keys, 2-space indent, UTF-8 (non-ASCII kept), trailing newline.
+_CANONICAL_OPTS = (
+    orjson.OPT_SORT_KEYS
+    | orjson.OPT_INDENT_2
+    | orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_APPEND_NEWLINE
+)
+
+
+def dumps_canonical(payload: Any, *, default: Callable[[Any], Any] | None = None) -> bytes:
+    """
+    Serialize payload to canonical artifact JSON bytes (orjson, C-level).
+    """
+    return orjson.dumps(payload, default=default, option=_CANONICAL_OPTS)
+
+
+def loads(data: bytes | str) -> Any:
+    return orjson.loads(data)
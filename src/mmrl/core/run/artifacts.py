@@ -1,18 +1,21 @@
 from __future__ import annotations
 
-import re
-from dataclasses import dataclass
+import os
+import string
+from dataclasses import dataclass, field
 from pathlib import Path
 
 
-_RUN_ID_RE = re.compile(r"^[A-Za-z0-9_\-]+$")
+# Allowed run_id characters: [A-Za-z0-9_-]. translate() deletes them, so a
+# valid ID translates to the empty string (no regex engine / Match object).
+_RUN_ID_STRIP = str.maketrans("", "", string.ascii_letters + string.digits + "_-")
 
 
 def validate_run_id(run_id: str) -> None:
     """
     Defensive: prevent path traversal or weird IDs.
     """
-    if not run_id or not _RUN_ID_RE.match(run_id):
+    if not run_id or not run_id.isascii() or run_id.translate(_RUN_ID_STRIP):
         raise ValueError(f"invalid run_id: {run_id!r}")
 
 
@@ -22,37 +25,49 @@ class RunArtifacts:
     Standard, stable artifact paths for a run.
 
     This is a *contract*. Everything else depends on these filenames.
+
+    All paths are derived once from run_dir at construction and stored as
+    plain slots, so hot paths (e.g. event logging) never rebuild Path objects.
     """
     run_dir: Path
 
-    @property
-    def config_json(self) -> Path:
-        return self.run_dir / "config.json"
-
-    @property
-    def meta_json(self) -> Path:
-        return self.run_dir / "meta.json"
-
-    @property
-    def events_jsonl(self) -> Path:
-        # Append-only event log (one JSON dict per line)
-        return self.run_dir / "events.jsonl"
-
-    @property
-    def metrics_json(self) -> Path:
-        return self.run_dir / "metrics.json"
-
-    @property
-    def evaluation_json(self) -> Path:
-        return self.run_dir / "evaluation.json"
-
-    @property
-    def logs_dir(self) -> Path:
-        return self.run_dir / "logs"
-
-    @property
-    def engine_log(self) -> Path:
-        return self.logs_dir / "engine.log"
+    # RunSpec canonical dict plus a "_spec_hash" key (RunFactory.save_spec)
+    config_json: Path = field(init=False, repr=False, compare=False)
+    meta_json: Path = field(init=False, repr=False, compare=False)
+    # Append-only event log (one JSON dict per line)
+    events_jsonl: Path = field(init=False, repr=False, compare=False)
+    metrics_json: Path = field(init=False, repr=False, compare=False)
+    evaluation_json: Path = field(init=False, repr=False, compare=False)
+    logs_dir: Path = field(init=False, repr=False, compare=False)
+    engine_log: Path = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        run_dir = self.run_dir
+        logs_dir = run_dir / "logs"
+        set_ = object.__setattr__  # frozen dataclass
+        set_(self, "config_json", run_dir / "config.json")
+        set_(self, "meta_json", run_dir / "meta.json")
+        set_(self, "events_jsonl", run_dir / "events.jsonl")
+        set_(self, "metrics_json", run_dir / "metrics.json")
+        set_(self, "evaluation_json", run_dir / "evaluation.json")
+        set_(self, "logs_dir", logs_dir)
+        set_(self, "engine_log", logs_dir / "engine.log")
+
+    @staticmethod
+    def str_paths(run_dir: str) -> dict[str, str]:
+        """
+        String form of the artifact paths under run_dir, built by plain string
+        concatenation (no Path objects). Keep in sync with the fields above.
+        """
+        base = run_dir + os.sep
+        return {
+            "config_json": base + "config.json",
+            "meta_json": base + "meta.json",
+            "events_jsonl": base + "events.jsonl",
+            "metrics_json": base + "metrics.json",
+            "evaluation_json": base + "evaluation.json",
+            "engine_log": base + "logs" + os.sep + "engine.log",
+        }
 
     def ensure_dirs(self) -> None:
         self.run_dir.mkdir(parents=True, exist_ok=True)
@@ -64,11 +79,11 @@ def artifacts_for(*, runs_dir: Path, run_id: str) -> RunArtifacts:
     Resolve artifacts for run_id under runs_dir (safe).
     """
     validate_run_id(run_id)
-    run_dir = (runs_dir / run_id).resolve()
+    base = os.path.realpath(runs_dir)
+    run_dir = os.path.realpath(os.path.join(base, run_id))
 
     # Ensure it stays under runs_dir
-    base = runs_dir.resolve()
-    if base not in run_dir.parents and run_dir != base:
+    if run_dir != base and not run_dir.startswith(base + os.sep):
         raise ValueError("invalid run_dir resolution")
 
-    return RunArtifacts(run_dir=run_dir)
+    return RunArtifacts(run_dir=Path(run_dir))
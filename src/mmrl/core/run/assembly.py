@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, Literal, Sequence
+from typing import Callable, Iterable, Literal, Sequence
 
 import structlog
 
@@ -11,6 +11,7 @@ from mmrl.core.engine.router import EngineRouter, RouterWiring
 from mmrl.core.engine.state import EngineState
 from mmrl.core.events.base import Event
 from mmrl.core.events.bus import EventBus
+from mmrl.core.events.system import RunStopped
 from mmrl.core.run.artifacts import RunArtifacts, artifacts_for
 from mmrl.storage.jsonl import JsonlEventStore
 
@@ -65,11 +66,21 @@ class EventLogComponent:
         "order.fill",
     )
 
-    def subscriptions(self) -> Sequence[tuple[str, callable]]:
-        return [(et, self._on_event) for et in self.event_types]
+    # Built once in __post_init__ (the bound method is shared by every entry)
+    _subs: tuple[tuple[str, Callable[[Event], None]], ...] = field(init=False, default=())
+
+    def __post_init__(self) -> None:
+        on_event = self._on_event
+        self._subs = tuple((et, on_event) for et in self.event_types)
+
+    def subscriptions(self) -> Sequence[tuple[str, Callable[[Event], None]]]:
+        return self._subs
 
     def _on_event(self, e: Event) -> None:
         self.store.append(e)
+        # Run boundary: drain the write buffer (and fsync) so the log is complete
+        if e.event_type == RunStopped.event_type:
+            self.store.flush()
 
 
 # ---------------------------
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 from typing import Sequence
 
 from mmrl.core.events.base import Event
+from mmrl.core.events.system import RunStopped
 from mmrl.core.run.artifacts import RunArtifacts
 from mmrl.storage.jsonl import JsonlWriter
 
@@ -15,8 +16,12 @@ class EventLogWriter:
     """
     artifacts: RunArtifacts
 
+    # One writer (one open handle) for the component's lifetime
+    _writer: JsonlWriter = field(init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
         self.artifacts.ensure_dirs()
+        object.__setattr__(self, "_writer", JsonlWriter(self.artifacts.events_jsonl))
 
     def subscriptions(self) -> Sequence[tuple[str, callable]]:
         # Subscribe to every event type you care about.
@@ -35,8 +40,23 @@ class EventLogWriter:
         ]
 
     def _on_event(self, e: Event) -> None:
-        writer = JsonlWriter(self.artifacts.events_jsonl)
-        writer.append(_event_to_dict(e))
+        self._writer.append(_event_to_dict(e))
+        # Run boundary: make everything written so far visible on disk
+        if e.event_type == RunStopped.event_type:
+            self._writer.flush()
+
+
+# Event class -> payload field names (excluding event_id/timestamp_utc), in
+# dataclass declaration order. Events are slotted, so there is no __dict__.
+_FIELDS_CACHE: dict[type, tuple[str, ...]] = {}
+
+
+def _field_names(cls: type) -> tuple[str, ...]:
+    names = _FIELDS_CACHE.get(cls)
+    if names is None:
+        names = tuple(f.name for f in fields(cls) if f.name not in ("event_id", "timestamp_utc"))
+        _FIELDS_CACHE[cls] = names
+    return names
 
 
 def _event_to_dict(e: Event) -> dict:
@@ -45,11 +65,6 @@ def _event_to_dict(e: Event) -> dict:
         "timestamp_utc": e.timestamp_utc.isoformat(),
         "event_type": e.event_type,
     }
-    # include dataclass fields if present
-    # avoid importing dataclasses.is_dataclass to keep it simple; rely on __dict__
-    if hasattr(e, "__dict__"):
-        for k, v in e.__dict__.items():
-            if k in ("event_id", "timestamp_utc"):
-                continue
-            d[k] = v
+    for name in _field_names(type(e)):
+        d[name] = getattr(e, name)
     return d
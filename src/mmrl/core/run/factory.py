@@ -1,22 +1,42 @@
 from __future__ import annotations
 
-import json
-from dataclasses import asdict, is_dataclass
 from pathlib import Path
 from typing import Any
 
 import structlog
 
+from mmrl.core.engine.router import RouterWiring
+from mmrl.core.run._json import dumps_canonical, loads
 from mmrl.core.run.artifacts import RunArtifacts, artifacts_for
 from mmrl.core.run.assembly import RunHandle, build_run
-from mmrl.core.run.spec import RunSpec
+from mmrl.core.run.spec import SPEC_HASH_KEY, RunSpec, construct_trusted, spec_digest
 
 from mmrl.marketdata.replay.datasource import ReplayDataSource
 from mmrl.marketdata.replay.jsonl_datasource import JsonlReplayDataSource
 from mmrl.strategies.baselines.fixed_spread import FixedSpreadConfig
 
+__all__ = ["RunFactory"]
+
 log = structlog.get_logger()
 
+# config.json path -> ((st_mtime_ns, st_size), parsed RunSpec, the hash stored
+# in the file). Keyed on mtime and size so any rewrite of the file invalidates the
+# entry; shared across factory instances.
+_SPEC_CACHE: dict[str, tuple[tuple[int, int], RunSpec, str]] = {}
+_SPEC_CACHE_MAX = 256
+
+
+def _stat_key(st: Any) -> tuple[int, int]:
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _remember_spec(path: str, stat_key: tuple[int, int], spec: RunSpec, spec_hash: str) -> None:
+    _SPEC_CACHE.pop(path, None)
+    _SPEC_CACHE[path] = (stat_key, spec, spec_hash)
+    if len(_SPEC_CACHE) > _SPEC_CACHE_MAX:
+        # Evict oldest insertion
+        _SPEC_CACHE.pop(next(iter(_SPEC_CACHE)), None)
+
 
 class RunFactory:
     """
@@ -36,24 +56,55 @@ class RunFactory:
     # -----------------------
 
     def load_spec(self, *, run_id: str) -> RunSpec:
-        art = artifacts_for(runs_dir=self.runs_dir, run_id=run_id)
-        if not art.run_dir.exists():
-            raise FileNotFoundError(f"run not found: {run_id}")
+        """
+        Load the persisted RunSpec.
 
-        if not art.config_json.exists():
+        Parsed specs are memoized by (path, mtime_ns, size): a warm start costs
+        one stat + copy instead of read + json decode + validation. Each call
+        returns its own copy, so callers may mutate it.
+        """
+        art = artifacts_for(runs_dir=self.runs_dir, run_id=run_id)
+        try:
+            st = art.config_json.stat()
+        except FileNotFoundError:
+            if not art.run_dir.exists():
+                raise FileNotFoundError(f"run not found: {run_id}")
             return RunSpec()
 
-        data = json.loads(art.config_json.read_text(encoding="utf-8"))
-        return RunSpec.model_validate(data)
+        key = str(art.config_json)
+        stat_key = _stat_key(st)
+        hit = _SPEC_CACHE.get(key)
+        if hit is not None and hit[0] == stat_key:
+            return hit[1].model_copy(deep=True)
+
+        data = loads(art.config_json.read_bytes())
+        # Files written by save_spec carry the hash of a validated spec; if the
+        # content still matches it, skip re-validation
+        stored_hash = data.pop(SPEC_HASH_KEY, None)
+        if stored_hash is not None and stored_hash == spec_digest(data):
+            spec = construct_trusted(data, stored_hash)
+        else:
+            spec = RunSpec.model_validate(data)
+            stored_hash = spec.config_hash()
+        _remember_spec(key, stat_key, spec, stored_hash)
+        return spec.model_copy(deep=True)
 
     def save_spec(self, *, run_id: str, spec: RunSpec) -> None:
         art = artifacts_for(runs_dir=self.runs_dir, run_id=run_id)
         art.ensure_dirs()
 
+        # Hash the payload actually written rather than the memoized
+        # config_hash(), which misses in-place edits of nested sub-models
         payload = spec.to_canonical_dict()
-        art.config_json.write_text(
-            json.dumps(payload, indent=2, sort_keys=True, ensure_ascii=False) + "\n",
-            encoding="utf-8",
+        spec_hash = spec_digest(payload)
+        art.config_json.write_bytes(dumps_canonical({**payload, SPEC_HASH_KEY: spec_hash}))
+
+        # The file now reflects this spec; seed the cache so the next load is a hit
+        _remember_spec(
+            str(art.config_json),
+            _stat_key(art.config_json.stat()),
+            construct_trusted(payload, spec_hash),
+            spec_hash,
         )
 
     # -----------------------
@@ -68,8 +119,11 @@ class RunFactory:
         if not art.run_dir.exists():
             raise FileNotFoundError(f"run not found: {run_id}")
 
-        # Persist the spec (source of truth)
-        self.save_spec(run_id=run_id, spec=spec)
+        # Persist the spec (source of truth), unless config.json already holds
+        # exactly this spec (the usual start path: load_spec -> build)
+        spec_hash = spec_digest(spec.to_canonical_dict())
+        if not self._is_persisted(art=art, spec_hash=spec_hash):
+            self.save_spec(run_id=run_id, spec=spec)
 
         # Translate StrategySpec -> StrategyConfig
         strategy_cfg = self._build_strategy_config(spec)
@@ -88,7 +142,7 @@ class RunFactory:
         )
 
         # Founder-level audit: write wiring snapshot
-        self._write_wiring_snapshot(art=handle.artifacts, spec=spec, handle=handle)
+        self._write_wiring_snapshot(art=handle.artifacts, spec=spec, spec_hash=spec_hash, handle=handle)
 
         return handle
 
@@ -96,6 +150,18 @@ class RunFactory:
     # Helpers
     # -----------------------
 
+    @staticmethod
+    def _is_persisted(*, art: RunArtifacts, spec_hash: str) -> bool:
+        # spec_hash must be freshly computed from the spec being built; it is
+        # compared against the hash stored in the unchanged config.json
+        hit = _SPEC_CACHE.get(str(art.config_json))
+        if hit is None or hit[2] != spec_hash:
+            return False
+        try:
+            return _stat_key(art.config_json.stat()) == hit[0]
+        except FileNotFoundError:
+            return False
+
     def _build_strategy_config(self, spec: RunSpec) -> FixedSpreadConfig:
         if spec.strategy.kind != "fixed_spread":
             raise ValueError(f"unsupported strategy kind: {spec.strategy.kind}")
@@ -127,16 +193,22 @@ class RunFactory:
 
         return JsonlReplayDataSource(path=replay_path)
 
-    def _write_wiring_snapshot(self, *, art: RunArtifacts, spec: RunSpec, handle: RunHandle) -> None:
+    def _write_wiring_snapshot(
+        self, *, art: RunArtifacts, spec: RunSpec, spec_hash: str, handle: RunHandle
+    ) -> None:
         """
         Writes a reproducible snapshot of what was wired.
         Uses meta.json (already part of your artifacts contract).
         """
-        components = [{"type": type(c).__name__, "module": type(c).__module__} for c in handle.components]
+        components = []
+        append = components.append
+        for c in handle.components:
+            cls = type(c)
+            append({"type": cls.__name__, "module": cls.__module__})
 
         snapshot: dict[str, Any] = {
             "run_id": handle.run_id,
-            "spec_hash": spec.config_hash(),
+            "spec_hash": spec_hash,
             "symbol": spec.symbol,
             "mode": spec.marketdata.mode,
             "strategy_kind": spec.strategy.kind,
@@ -145,14 +217,36 @@ class RunFactory:
         }
 
         try:
-            w = handle.wiring
-            snapshot["router_wiring"] = asdict(w) if is_dataclass(w) else str(w)
+            snapshot["router_wiring"] = _wiring_view(handle.wiring)
         except Exception:
             snapshot["router_wiring"] = "unavailable"
 
-        art.meta_json.write_text(
-            json.dumps(snapshot, indent=2, sort_keys=True, ensure_ascii=False) + "\n",
-            encoding="utf-8",
-        )
+        art.meta_json.write_bytes(dumps_canonical(snapshot, default=str))
 
         log.info("run.wiring_snapshot_written", run_id=handle.run_id, spec_hash=snapshot["spec_hash"])
+
+
+def _wiring_view(w: Any) -> Any:
+    """
+    Shallow JSON view of RouterWiring.
+
+    Avoids asdict()'s recursive deepcopy and records handlers by qualified name
+    (stable across processes) instead of their repr.
+    """
+    if not isinstance(w, RouterWiring):
+        return str(w)
+    subs = []
+    append = subs.append
+    for ws in w.subscriptions:
+        sub = ws.subscription
+        handler = sub.handler
+        append(
+            {
+                "component": ws.component,
+                "subscription": {
+                    "event_type": sub.event_type,
+                    "handler": getattr(handler, "__qualname__", None) or repr(handler),
+                },
+            }
+        )
+    return {"subscriptions": subs}
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import json
+import functools
 import os
 import platform
 import secrets
@@ -14,6 +14,9 @@ from typing import Any, Mapping
 import structlog
 
 from mmrl.core.logging.setup import bind_context
+from mmrl.core.run._json import dumps_canonical
+
+__all__ = ["RunInfo", "RunManager"]
 
 log = structlog.get_logger()
 
@@ -124,46 +127,68 @@ class RunManager:
         path: Path,
         payload: Any,
         default: Any | None = None,
+        fsync: bool = False,
     ) -> None:
         """
         Atomic JSON write:
         write to tmp file then replace, so readers never see partial JSON.
+
+        Pre-encoded bytes go straight to the fd (no buffered text layer);
+        fsync=True additionally makes the content durable before the rename.
         """
         tmp = path.with_suffix(path.suffix + ".tmp")
-        data = json.dumps(payload, indent=2, sort_keys=True, default=default)
-        tmp.write_text(data)
-        tmp.replace(path)
+        view = memoryview(dumps_canonical(payload, default=default))
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while view:
+                view = view[os.write(fd, view):]
+            if fsync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
 
     def _try_get_git_commit(self) -> str | None:
         """
         Best-effort git commit capture without shelling out.
         Returns None if not in a git repo.
         """
-        try:
-            # Walk up from cwd until we find .git
-            cur = Path.cwd()
-            for _ in range(15):
-                git_dir = cur / ".git"
-                if git_dir.exists():
-                    head = (git_dir / "HEAD").read_text().strip()
-                    if head.startswith("ref:"):
-                        ref = head.split(":", 1)[1].strip()
-                        ref_path = git_dir / ref
-                        if ref_path.exists():
-                            return ref_path.read_text().strip()[:40]
-                        # Packed refs (best-effort)
-                        packed = git_dir / "packed-refs"
-                        if packed.exists():
-                            for line in packed.read_text().splitlines():
-                                if line.startswith("#") or line.startswith("^") or not line.strip():
-                                    continue
-                                sha, name = line.split(" ", 1)
-                                if name.strip() == ref:
-                                    return sha.strip()[:40]
-                        return None
-                    # Detached HEAD
-                    return head[:40] if head else None
-                cur = cur.parent
-        except Exception:
-            return None
+        return _resolve_git_commit(os.getcwd())
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_git_commit(cwd: str) -> str | None:
+    """
+    Walk up from cwd to the nearest .git and resolve HEAD.
+
+    Cached per cwd: the commit does not change for the lifetime of a process
+    in practice, so the .git walk and ref reads happen once.
+    """
+    try:
+        cur = Path(cwd)
+        for _ in range(15):
+            git_dir = cur / ".git"
+            if git_dir.exists():
+                head = (git_dir / "HEAD").read_text().strip()
+                if head.startswith("ref:"):
+                    ref = head.split(":", 1)[1].strip()
+                    ref_path = git_dir / ref
+                    if ref_path.exists():
+                        return ref_path.read_text().strip()[:40]
+                    # Packed refs (best-effort)
+                    packed = git_dir / "packed-refs"
+                    if packed.exists():
+                        for line in packed.read_text().splitlines():
+                            # Only split the line that names our ref
+                            if not line.rstrip().endswith(ref) or line.startswith(("#", "^")):
+                                continue
+                            sha, name = line.split(" ", 1)
+                            if name.strip() == ref:
+                                return sha.strip()[:40]
+                    return None
+                # Detached HEAD
+                return head[:40] if head else None
+            cur = cur.parent
+    except Exception:
         return None
+    return None
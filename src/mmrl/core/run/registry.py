@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from threading import Lock
 from typing import Literal
 
@@ -10,13 +12,20 @@ from mmrl.core.run.manager import RunInfo
 # This is what your API imports
 RunStatus = Literal["created", "running", "stopped", "error"]
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
-@dataclass(frozen=True, slots=True)
+
+def _ns_to_datetime(ns: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=ns // 1000)
+
+
+@dataclass(slots=True)
 class RunRecord:
     """
     In-memory view of a run for API/ops visibility.
 
     Durable truth is still the run directory on disk.
+    Status fields are updated in place by RunRegistry; callers treat records as read-only.
     """
     run_id: str
     run_dir: str
@@ -24,11 +33,16 @@ class RunRecord:
 
     status: RunStatus
     created_at_utc: datetime
-    updated_at_utc: datetime
+    # Raw time.time_ns(): stamping is a single clock read, datetime built on read
+    updated_at_ns: int
 
     error_type: str | None = None
     error_message: str | None = None
 
+    @property
+    def updated_at_utc(self) -> datetime:
+        return _ns_to_datetime(self.updated_at_ns)
+
 
 class RunRegistry:
     """
@@ -37,20 +51,21 @@ class RunRegistry:
 
     def __init__(self) -> None:
         self._lock = Lock()
-        self._runs: dict[str, RunRecord] = {}
+        # Ordered by last update (most recent last), so list() never sorts
+        self._runs: OrderedDict[str, RunRecord] = OrderedDict()
 
     def upsert_created(self, run: RunInfo) -> RunRecord:
-        now = datetime.now(timezone.utc)
         rec = RunRecord(
             run_id=run.run_id,
             run_dir=str(run.run_dir),
             seed=run.seed,
             status="created",
             created_at_utc=run.created_at_utc,
-            updated_at_utc=now,
+            updated_at_ns=time.time_ns(),
         )
         with self._lock:
             self._runs[run.run_id] = rec
+            self._runs.move_to_end(run.run_id)
         return rec
 
     def mark_running(self, *, run_id: str) -> None:
@@ -60,68 +75,52 @@ class RunRegistry:
         self._set_status(run_id=run_id, status="stopped")
 
     def mark_error(self, *, run_id: str, error_type: str, error_message: str) -> None:
-        with self._lock:
-            cur = self._runs.get(run_id)
-            now = datetime.now(timezone.utc)
-
-            if cur is None:
-                # Keep it minimal but visible
-                self._runs[run_id] = RunRecord(
-                    run_id=run_id,
-                    run_dir="",
-                    seed=0,
-                    status="error",
-                    created_at_utc=now,
-                    updated_at_utc=now,
-                    error_type=error_type,
-                    error_message=error_message,
-                )
-                return
-
-            self._runs[run_id] = RunRecord(
-                run_id=cur.run_id,
-                run_dir=cur.run_dir,
-                seed=cur.seed,
-                status="error",
-                created_at_utc=cur.created_at_utc,
-                updated_at_utc=now,
-                error_type=error_type,
-                error_message=error_message,
-            )
+        self._set_status(
+            run_id=run_id,
+            status="error",
+            error_type=error_type,
+            error_message=error_message,
+        )
 
     def get(self, *, run_id: str) -> RunRecord | None:
         with self._lock:
             return self._runs.get(run_id)
 
     def list(self) -> list[RunRecord]:
+        """
+        All runs, most recently updated first.
+        """
         with self._lock:
-            items = list(self._runs.values())
-        items.sort(key=lambda r: r.updated_at_utc, reverse=True)
-        return items
-
-    def _set_status(self, *, run_id: str, status: RunStatus) -> None:
+            return list(reversed(self._runs.values()))
+
+    def _set_status(
+        self,
+        *,
+        run_id: str,
+        status: RunStatus,
+        error_type: str | None = None,
+        error_message: str | None = None,
+    ) -> None:
+        now_ns = time.time_ns()
         with self._lock:
             cur = self._runs.get(run_id)
-            now = datetime.now(timezone.utc)
-
             if cur is None:
+                # Keep it minimal but visible
                 self._runs[run_id] = RunRecord(
                     run_id=run_id,
                     run_dir="",
                     seed=0,
                     status=status,
-                    created_at_utc=now,
-                    updated_at_utc=now,
+                    created_at_utc=_ns_to_datetime(now_ns),
+                    updated_at_ns=now_ns,
+                    error_type=error_type,
+                    error_message=error_message,
                 )
                 return
 
-            self._runs[run_id] = RunRecord(
-                run_id=cur.run_id,
-                run_dir=cur.run_dir,
-                seed=cur.seed,
-                status=status,
-                created_at_utc=cur.created_at_utc,
-                updated_at_utc=now,
-                error_type=None,
-                error_message=None,
-            )
+            # Update in place: no record reallocation on status changes
+            cur.status = status
+            cur.updated_at_ns = now_ns
+            cur.error_type = error_type
+            cur.error_message = error_message
+            self._runs.move_to_end(run_id)
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import hashlib
-import json
 from datetime import datetime, timezone
 from typing import Literal, Optional
 
-from pydantic import BaseModel, Field, model_validator
+import orjson
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 
 # -----------------------
@@ -36,18 +36,22 @@ class FixedSpreadParams(BaseModel):
     min_ticks_between_quotes: int = Field(1, ge=1, description="Min ticks between re-quotes")
 
 
+# Literal, known-valid defaults: built once without validation, and handed out
+# as shallow copies so specs never share a mutable sub-model.
+_DEFAULT_FIXED_SPREAD = FixedSpreadParams.model_construct(
+    _fields_set=set(),
+    spread=1.0,
+    order_size=0.001,
+    max_inventory=0.01,
+    inventory_skew_k=0.0,
+    min_mid_move=0.0,
+    min_ticks_between_quotes=1,
+)
+
+
 class StrategySpec(BaseModel):
     kind: StrategyKind = Field(default="fixed_spread")
-    fixed_spread: FixedSpreadParams = Field(
-        default_factory=lambda: FixedSpreadParams(
-            spread=1.0,
-            order_size=0.001,
-            max_inventory=0.01,
-            inventory_skew_k=0.0,
-            min_mid_move=0.0,
-            min_ticks_between_quotes=1,
-        )
-    )
+    fixed_spread: FixedSpreadParams = Field(default_factory=_DEFAULT_FIXED_SPREAD.model_copy)
 
     @model_validator(mode="after")
     def _validate_kind_payload(self) -> "StrategySpec":
@@ -83,13 +87,26 @@ class MarketDataSpec(BaseModel):
         return self
 
 
+_DEFAULT_MARKETDATA_SPEC = MarketDataSpec.model_construct(set(), mode="paper_no_marketdata", replay_l2=None)
+_DEFAULT_EXECUTION_SPEC = ExecutionSpec.model_construct(set(), kind="paper")
+
+
+def _default_strategy_spec() -> StrategySpec:
+    return StrategySpec.model_construct(
+        set(),
+        kind="fixed_spread",
+        fixed_spread=_DEFAULT_FIXED_SPREAD.model_copy(),
+    )
+
+
 # -----------------------
 # The RunSpec (top-level)
 # -----------------------
 
 class RunSpec(BaseModel):
     """
-    Canonical run configuration. This is the object you persist to artifacts/config.json.
+    Canonical run configuration. This is the object you persist to artifacts/config.json
+    (its canonical dict, plus the SPEC_HASH_KEY entry written by RunFactory.save_spec).
 
     Founder-grade properties:
     - deterministic config hash
@@ -104,9 +121,9 @@ class RunSpec(BaseModel):
     created_at_utc: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
     # Components
-    marketdata: MarketDataSpec = Field(default_factory=MarketDataSpec)
-    execution: ExecutionSpec = Field(default_factory=ExecutionSpec)
-    strategy: StrategySpec = Field(default_factory=StrategySpec)
+    marketdata: MarketDataSpec = Field(default_factory=_DEFAULT_MARKETDATA_SPEC.model_copy)
+    execution: ExecutionSpec = Field(default_factory=_DEFAULT_EXECUTION_SPEC.model_copy)
+    strategy: StrategySpec = Field(default_factory=_default_strategy_spec)
 
     # Optional metadata knobs
     seed: Optional[int] = Field(default=None, description="Optional RNG seed override")
@@ -122,10 +139,70 @@ class RunSpec(BaseModel):
         d["created_at_utc"] = self.created_at_utc.astimezone(timezone.utc).isoformat()
         return d
 
+    # Memoized config_hash(); reset whenever a top-level field is reassigned
+    _hash: Optional[str] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value) -> None:
+        if name in type(self).model_fields:
+            self._hash = None
+        super().__setattr__(name, value)
+
     def config_hash(self) -> str:
         """
         Deterministic hash of the spec. This becomes your run fingerprint.
+
+        Computed once and cached; nested sub-models must not be mutated in place
+        after the first call.
         """
-        payload = self.to_canonical_dict()
-        blob = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
-        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+        h = self._hash
+        if h is None:
+            h = self._hash = spec_digest(self.to_canonical_dict())
+        return h
+
+
+# -----------------------
+# Trusted round-trips
+# -----------------------
+
+# Key stored alongside the canonical dict in config.json by RunFactory.save_spec
+# (part of the config.json contract; readers of the spec fields should ignore it).
+# It equals spec_digest() of the canonical dict that was written.
+SPEC_HASH_KEY = "_spec_hash"
+
+
+def spec_digest(payload: dict) -> str:
+    # Non-cryptographic fingerprint: BLAKE2b-256 (stdlib) over canonical orjson bytes
+    blob = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(blob, digest_size=32).hexdigest()
+
+
+def construct_trusted(data: dict, spec_hash: str) -> RunSpec:
+    """
+    Rebuild a RunSpec from a canonical dict without validation.
+
+    Only for payloads produced by to_canonical_dict() of an already-validated
+    spec (checked by the caller via SPEC_HASH_KEY). The hash is unkeyed: it
+    detects accidental edits of config.json, not deliberate ones, so it is no
+    trust boundary for files from untrusted sources.
+    """
+    md = data["marketdata"]
+    replay = md.get("replay_l2")
+    strategy = data["strategy"]
+    spec = RunSpec.model_construct(
+        schema_version=data["schema_version"],
+        symbol=data["symbol"],
+        created_at_utc=datetime.fromisoformat(data["created_at_utc"]),
+        marketdata=MarketDataSpec.model_construct(
+            mode=md["mode"],
+            replay_l2=None if replay is None else ReplayL2Spec.model_construct(**replay),
+        ),
+        execution=ExecutionSpec.model_construct(**data["execution"]),
+        strategy=StrategySpec.model_construct(
+            kind=strategy["kind"],
+            fixed_spread=FixedSpreadParams.model_construct(**strategy["fixed_spread"]),
+        ),
+        seed=data["seed"],
+        tags=data["tags"],
+    )
+    spec._hash = spec_hash
+    return spec
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from math import isfinite
-from typing import Protocol
+from typing import Iterable, Protocol
 
 from mmrl.core.events.marketdata import BestBidAskUpdate
 from mmrl.execution.oms.orders import OrderRecord
@@ -37,6 +37,10 @@ class FillDecision:
             raise ValueError("fill_qty exceeds remaining")
 
 
+# Shared negative result: frozen, so one instance serves every non-crossing check
+_NOT_EXECUTABLE = FillDecision(executable=False)
+
+
 class FillModel(Protocol):
     """
     A deterministic fill model.
@@ -46,6 +50,30 @@ class FillModel(Protocol):
         ...
 
 
+def decide_batch(
+    model: FillModel,
+    *,
+    orders: Iterable[OrderRecord],
+    bbo: BestBidAskUpdate,
+) -> list[tuple[OrderRecord, FillDecision]]:
+    """
+    Decide fills for many resting orders against one BBO.
+
+    Returns only executable (order, decision) pairs, in input order. Uses the
+    model's own decide_batch when it has one (BBO checks hoisted out of the
+    per-order loop), else falls back to per-order decide().
+    """
+    batch = getattr(model, "decide_batch", None)
+    if batch is not None:
+        return batch(orders=orders, bbo=bbo)
+    out = []
+    for order in orders:
+        d = model.decide(order=order, bbo=bbo)
+        if d.executable:
+            out.append((order, d))
+    return out
+
+
 @dataclass(frozen=True, slots=True)
 class TopOfBookFullFillModel:
     """
@@ -56,40 +84,85 @@ class TopOfBookFullFillModel:
       - Limit sell executes when price <= bid, fills at bid.
       - Full fill: fill_qty = remaining.
       - No market orders here (price None -> not executable).
+
+    The crossing test runs first: almost every check is a resting order that
+    does not cross, and NaN prices fail it as well. Validity guards only run
+    once an order crosses.
     """
     eps: float = 1e-12
 
     def decide(self, *, order: OrderRecord, bbo: BestBidAskUpdate) -> FillDecision:
-        if order.status != "open":
-            return FillDecision(executable=False)
-
-        if order.price is None:
-            return FillDecision(executable=False)
-
-        if not isfinite(order.price) or not isfinite(order.remaining):
-            return FillDecision(executable=False)
-
+        px = order.price
+        if px is None:
+            return _NOT_EXECUTABLE
+
+        eps = self.eps
+        if order.is_buy:
+            fill_price = bbo.ask_price
+            if not px + eps >= fill_price:
+                return _NOT_EXECUTABLE
+        else:
+            fill_price = bbo.bid_price
+            if not px - eps <= fill_price:
+                return _NOT_EXECUTABLE
+
+        rem = order.remaining
+        if (
+            order.status != "open"
+            or not isfinite(px)
+            or not isfinite(rem)
+            or rem <= eps
+            or not _finite_pos(bbo.bid_price)
+            or not _finite_pos(bbo.ask_price)
+        ):
+            return _NOT_EXECUTABLE
+
+        d = FillDecision(executable=True, fill_price=fill_price, fill_qty=rem)
+        if __debug__:
+            d.validate(remaining=rem, eps=eps)
+        return d
+
+    def decide_batch(
+        self,
+        *,
+        orders: Iterable[OrderRecord],
+        bbo: BestBidAskUpdate,
+    ) -> list[tuple[OrderRecord, FillDecision]]:
+        """
+        Same rules as decide(), with the BBO checks done once for all orders.
+
+        No status check per order: filled and canceled orders have remaining
+        zeroed, so the remaining guard already excludes them.
+        """
         bid = bbo.bid_price
         ask = bbo.ask_price
         if not _finite_pos(bid) or not _finite_pos(ask):
-            return FillDecision(executable=False)
-
-        if order.remaining <= self.eps:
-            return FillDecision(executable=False)
-
-        if order.side == "buy":
-            if order.price + self.eps >= ask:
-                d = FillDecision(executable=True, fill_price=ask, fill_qty=order.remaining)
-                d.validate(remaining=order.remaining, eps=self.eps)
-                return d
-            return FillDecision(executable=False)
-
-        # sell
-        if order.price - self.eps <= bid:
-            d = FillDecision(executable=True, fill_price=bid, fill_qty=order.remaining)
-            d.validate(remaining=order.remaining, eps=self.eps)
-            return d
-        return FillDecision(executable=False)
+            return []
+
+        eps = self.eps
+        out: list[tuple[OrderRecord, FillDecision]] = []
+        for order in orders:
+            px = order.price
+            if px is None:
+                continue
+            if order.is_buy:
+                if px + eps < ask:
+                    continue
+                fill_price = ask
+            else:
+                if px - eps > bid:
+                    continue
+                fill_price = bid
+
+            rem = order.remaining
+            if not isfinite(px) or not isfinite(rem) or rem <= eps:
+                continue
+
+            d = FillDecision(executable=True, fill_price=fill_price, fill_qty=rem)
+            if __debug__:
+                d.validate(remaining=rem, eps=eps)
+            out.append((order, d))
+        return out
 
 
 @dataclass(frozen=True, slots=True)
@@ -107,38 +180,86 @@ class TopOfBookCappedFillModel:
     eps: float = 1e-12
 
     def decide(self, *, order: OrderRecord, bbo: BestBidAskUpdate) -> FillDecision:
-        if order.status != "open":
-            return FillDecision(executable=False)
-
-        if order.price is None:
-            return FillDecision(executable=False)
-
-        if not isfinite(order.price) or not isfinite(order.remaining):
-            return FillDecision(executable=False)
-
+        px = order.price
+        if px is None:
+            return _NOT_EXECUTABLE
+
+        eps = self.eps
+        if order.is_buy:
+            fill_price = bbo.ask_price
+            size = bbo.ask_size
+            if not px + eps >= fill_price:
+                return _NOT_EXECUTABLE
+        else:
+            fill_price = bbo.bid_price
+            size = bbo.bid_size
+            if not px - eps <= fill_price:
+                return _NOT_EXECUTABLE
+
+        rem = order.remaining
+        if (
+            order.status != "open"
+            or not isfinite(px)
+            or not isfinite(rem)
+            or rem <= eps
+            or not _finite_pos(bbo.bid_price)
+            or not _finite_pos(bbo.ask_price)
+            or not isfinite(bbo.bid_size)
+            or not isfinite(bbo.ask_size)
+            or size <= eps
+        ):
+            return _NOT_EXECUTABLE
+
+        d = FillDecision(executable=True, fill_price=fill_price, fill_qty=min(rem, size))
+        if __debug__:
+            d.validate(remaining=rem, eps=eps)
+        return d
+
+    def decide_batch(
+        self,
+        *,
+        orders: Iterable[OrderRecord],
+        bbo: BestBidAskUpdate,
+    ) -> list[tuple[OrderRecord, FillDecision]]:
+        """
+        Same rules as decide(), with the BBO checks done once for all orders.
+
+        No status check per order: filled and canceled orders have remaining
+        zeroed, so the remaining guard already excludes them.
+        """
         bid = bbo.bid_price
         ask = bbo.ask_price
         if not _finite_pos(bid) or not _finite_pos(ask):
-            return FillDecision(executable=False)
-
-        if order.remaining <= self.eps:
-            return FillDecision(executable=False)
-
-        if not isfinite(bbo.bid_size) or not isfinite(bbo.ask_size):
-            return FillDecision(executable=False)
-
-        if order.side == "buy":
-            if order.price + self.eps >= ask and bbo.ask_size > self.eps:
-                qty = min(order.remaining, bbo.ask_size)
-                d = FillDecision(executable=True, fill_price=ask, fill_qty=qty)
-                d.validate(remaining=order.remaining, eps=self.eps)
-                return d
-            return FillDecision(executable=False)
-
-        # sell
-        if order.price - self.eps <= bid and bbo.bid_size > self.eps:
-            qty = min(order.remaining, bbo.bid_size)
-            d = FillDecision(executable=True, fill_price=bid, fill_qty=qty)
-            d.validate(remaining=order.remaining, eps=self.eps)
-            return d
-        return FillDecision(executable=False)
+            return []
+
+        bid_size = bbo.bid_size
+        ask_size = bbo.ask_size
+        if not isfinite(bid_size) or not isfinite(ask_size):
+            return []
+
+        eps = self.eps
+        out: list[tuple[OrderRecord, FillDecision]] = []
+        for order in orders:
+            px = order.price
+            if px is None:
+                continue
+            if order.is_buy:
+                if px + eps < ask or ask_size <= eps:
+                    continue
+                fill_price = ask
+                size = ask_size
+            else:
+                if px - eps > bid or bid_size <= eps:
+                    continue
+                fill_price = bid
+                size = bid_size
+
+            rem = order.remaining
+            if not isfinite(px) or not isfinite(rem) or rem <= eps:
+                continue
+
+            d = FillDecision(executable=True, fill_price=fill_price, fill_qty=min(rem, size))
+            if __debug__:
+                d.validate(remaining=rem, eps=eps)
+            out.append((order, d))
+        return out
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Literal
 
 from mmrl.core.events.orders import OrderSide
@@ -21,18 +21,29 @@ class OrderRecord:
 
     status: OrderStatus = "open"
 
+    # side == "buy", resolved once (fill models test it on every BBO)
+    is_buy: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.is_buy = self.side == "buy"
+
     def apply_fill(self, *, fill_qty: float) -> None:
         if self.status != "open":
             return
         if fill_qty <= 0:
             raise ValueError("fill_qty must be > 0")
-        if fill_qty > self.remaining + 1e-12:
+        remaining = self.remaining
+        if fill_qty > remaining + 1e-12:
             raise ValueError("fill_qty exceeds remaining")
 
-        self.remaining -= fill_qty
-        if self.remaining <= 1e-12:
+        # Compute in a local, write each slot once
+        remaining -= fill_qty
+        if remaining <= 1e-12:
             self.remaining = 0.0
             self.status = "filled"
+        else:
+            self.remaining = remaining
+
     def cancel(self) -> None:
         if self.status != "open":
             return
@@ -16,23 +16,30 @@ class Position:
             raise ValueError("price must be > 0")
 
         signed = qty if side == "buy" else -qty
+        inv = self.inventory
 
         # If inventory is zero, reset avg_price to fill price
-        if abs(self.inventory) < 1e-12:
+        if -1e-12 < inv < 1e-12:
             self.inventory = signed
             self.avg_price = price
             return
 
-        # Same direction: update weighted avg
-        if (self.inventory > 0 and signed > 0) or (self.inventory < 0 and signed < 0):
-            new_inv = self.inventory + signed
-            self.avg_price = (self.avg_price * abs(self.inventory) + price * abs(signed)) / abs(new_inv)
+        new_inv = inv + signed
+
+        # Same direction: update weighted avg (|inv|, |new_inv| known from the sign branch)
+        if inv > 0.0:
+            if signed > 0.0:
+                self.avg_price = (self.avg_price * inv + price * qty) / new_inv
+                self.inventory = new_inv
+                return
+        elif inv < 0.0 and signed < 0.0:
+            self.avg_price = (self.avg_price * -inv + price * qty) / -new_inv
             self.inventory = new_inv
             return
 
         # Opposite direction: reduce position (avg stays for remaining)
-        new_inv = self.inventory + signed
-        self.inventory = new_inv
-        if abs(self.inventory) < 1e-12:
+        if -1e-12 < new_inv < 1e-12:
             self.inventory = 0.0
             self.avg_price = 0.0
+        else:
+            self.inventory = new_inv
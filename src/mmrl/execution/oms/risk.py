@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass
 from math import isfinite
 from typing import Literal
@@ -29,6 +30,26 @@ class RiskCheckResult:
     reason: str  # machine-friendly code
 
 
+@dataclass(slots=True)
+class _SymbolExposure:
+    """
+    Mutable per-symbol risk state: one dict lookup reaches both numbers.
+    """
+    inventory: float = 0.0
+    reserved: float = 0.0
+
+
+_EPS = 1e-12
+
+# Results are frozen and carry no per-call data: share one instance per outcome
+_OK = RiskCheckResult(True, "ok")
+_REJECT_QTY_INVALID = RiskCheckResult(False, "qty_non_positive_or_invalid")
+_REJECT_QTY_MAX = RiskCheckResult(False, "qty_exceeds_max_order_qty")
+_REJECT_PRICE_INVALID = RiskCheckResult(False, "invalid_price")
+_REJECT_NOTIONAL_MAX = RiskCheckResult(False, "notional_exceeds_max_order_notional")
+_REJECT_INVENTORY = RiskCheckResult(False, "inventory_limit_breach")
+
+
 class RiskManager:
     """
     Deterministic risk manager.
@@ -39,27 +60,37 @@ class RiskManager:
         so multiple in-flight orders cannot bypass limits.
     """
 
-    _EPS: float = 1e-12
+    _EPS: float = _EPS
 
     def __init__(self, *, limits: RiskLimits) -> None:
         self._limits = limits
-        self._inventory_by_symbol: dict[str, float] = {}
-        self._reserved_by_symbol: dict[str, float] = {}
+
+        # Limits are immutable: fold the epsilon tolerance in once so each check
+        # is a single compare against a plain instance attribute
+        self._qty_cap = limits.max_order_qty + _EPS
+        self._inventory_cap = limits.max_abs_inventory + _EPS
+        self._notional_cap = (
+            None if limits.max_order_notional is None else limits.max_order_notional + _EPS
+        )
+        # Symbol universe is bounded per session, so materializing on first read is fine
+        self._by_symbol: defaultdict[str, _SymbolExposure] = defaultdict(_SymbolExposure)
 
         # Track reservations by order_id so cancels/fills can release deterministically
-        self._reservation_by_order_id: dict[str, tuple[str, float]] = {}  # order_id -> (symbol, signed_qty)
+        # order_id -> (symbol exposure, signed_qty)
+        self._reservation_by_order_id: dict[str, tuple[_SymbolExposure, float]] = {}
 
     def inventory(self, *, symbol: str) -> float:
-        return self._inventory_by_symbol.get(symbol, 0.0)
+        return self._by_symbol[symbol].inventory
 
     def reserved(self, *, symbol: str) -> float:
-        return self._reserved_by_symbol.get(symbol, 0.0)
+        return self._by_symbol[symbol].reserved
 
-    def _signed(self, *, side: Side, qty: float) -> float:
+    @staticmethod
+    def _signed(side: Side, qty: float) -> float:
         return qty if side == "buy" else -qty
 
     def _validate_qty(self, qty: float) -> bool:
-        return isfinite(qty) and qty > self._EPS
+        return isfinite(qty) and qty > _EPS
 
     def _validate_price(self, price: float | None) -> bool:
         return price is None or (isfinite(price) and price > 0.0)
@@ -73,18 +104,22 @@ class RiskManager:
         if not self._validate_qty(qty):
             raise ValueError("qty must be finite and > 0")
 
-        signed = self._signed(side=side, qty=qty)
-        self._inventory_by_symbol[symbol] = self.inventory(symbol=symbol) + signed
+        exp = self._by_symbol[symbol]
+        exp.inventory += qty if side == "buy" else -qty
 
         # Release reservation if this fill corresponds to a reserved order
-        if order_id is not None and order_id in self._reservation_by_order_id:
-            rsym, rqty = self._reservation_by_order_id.pop(order_id)
-            if rsym == symbol:
-                self._reserved_by_symbol[symbol] = self.reserved(symbol=symbol) - rqty
+        if order_id is None:
+            return
+        res = self._reservation_by_order_id.pop(order_id, None)
+        if res is not None:
+            rexp, rqty = res
+            if rexp is exp:
+                reserved = exp.reserved - rqty
 
                 # Clean near-zero drift
-                if abs(self._reserved_by_symbol[symbol]) <= self._EPS:
-                    self._reserved_by_symbol[symbol] = 0.0
+                if abs(reserved) <= _EPS:
+                    reserved = 0.0
+                exp.reserved = reserved
 
     def on_cancel(self, *, order_id: str) -> None:
         """
@@ -93,10 +128,9 @@ class RiskManager:
         rec = self._reservation_by_order_id.pop(order_id, None)
         if rec is None:
             return
-        symbol, signed_qty = rec
-        self._reserved_by_symbol[symbol] = self.reserved(symbol=symbol) - signed_qty
-        if abs(self._reserved_by_symbol[symbol]) <= self._EPS:
-            self._reserved_by_symbol[symbol] = 0.0
+        exp, signed_qty = rec
+        reserved = exp.reserved - signed_qty
+        exp.reserved = 0.0 if abs(reserved) <= _EPS else reserved
 
     def check_new_order(
         self,
@@ -119,30 +153,31 @@ class RiskManager:
         Note: conservative: assumes full fill.
         """
         if not self._validate_qty(qty):
-            return RiskCheckResult(ok=False, reason="qty_non_positive_or_invalid")
+            return _REJECT_QTY_INVALID
 
-        if qty > self._limits.max_order_qty + self._EPS:
-            return RiskCheckResult(ok=False, reason="qty_exceeds_max_order_qty")
+        if qty > self._qty_cap:
+            return _REJECT_QTY_MAX
 
         if not self._validate_price(price):
-            return RiskCheckResult(ok=False, reason="invalid_price")
+            return _REJECT_PRICE_INVALID
 
-        if self._limits.max_order_notional is not None and price is not None:
+        notional_cap = self._notional_cap
+        if notional_cap is not None and price is not None:
             notional = qty * price
-            if not isfinite(notional) or notional > self._limits.max_order_notional + self._EPS:
-                return RiskCheckResult(ok=False, reason="notional_exceeds_max_order_notional")
+            if not isfinite(notional) or notional > notional_cap:
+                return _REJECT_NOTIONAL_MAX
 
-        inv = self.inventory(symbol=symbol)
-        reserved = self.reserved(symbol=symbol)
-        signed = self._signed(side=side, qty=qty)
+        exp = self._by_symbol[symbol]
+        reserved = exp.reserved
+        signed = self._signed(side, qty)
 
-        projected = inv + reserved + signed
-        if abs(projected) > self._limits.max_abs_inventory + self._EPS:
-            return RiskCheckResult(ok=False, reason="inventory_limit_breach")
+        projected = exp.inventory + reserved + signed
+        if abs(projected) > self._inventory_cap:
+            return _REJECT_INVENTORY
 
         # If an order_id is provided, reserve immediately (idempotent)
         if order_id is not None and order_id not in self._reservation_by_order_id:
-            self._reservation_by_order_id[order_id] = (symbol, signed)
-            self._reserved_by_symbol[symbol] = reserved + signed
+            self._reservation_by_order_id[order_id] = (exp, signed)
+            exp.reserved = reserved + signed
 
-        return RiskCheckResult(ok=True, reason="ok")
+        return _OK
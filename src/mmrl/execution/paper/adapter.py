@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import logging
+
 import structlog
 
 from mmrl.core.engine.state import EngineState
@@ -14,13 +16,22 @@ from mmrl.core.events.orders import (
     OrderRejected,
     OrderSubmitted,
 )
-from mmrl.execution.model.fill_model import FillModel, TopOfBookFullFillModel
+from mmrl.core.logging.setup import is_debug_enabled, is_level_enabled
+from mmrl.execution.model.fill_model import (
+    FillDecision,
+    FillModel,
+    TopOfBookFullFillModel,
+    decide_batch,
+)
 from mmrl.execution.oms.orders import OrderRecord
 from mmrl.execution.oms.positions import Position
 from mmrl.execution.oms.risk import RiskLimits, RiskManager
 
 log = structlog.get_logger()
 
+# Cap on remembered closed order ids (debug logging only)
+_CLOSED_IDS_MAX = 4096
+
 
 class PaperExecutionAdapter:
     """
@@ -63,15 +74,25 @@ class PaperExecutionAdapter:
         # Latest BBO per symbol
         self._bbo_by_symbol: dict[str, BestBidAskUpdate] = {}
 
-        # OMS: order_id -> OrderRecord
+        # OMS: order_id -> OrderRecord, open orders only. Records leave on
+        # fill-to-zero or cancel, so a repeated cancel misses in one lookup.
         self._orders: dict[str, OrderRecord] = {}
 
-        # Fast index: symbol -> set(order_id)
-        self._orders_by_symbol: dict[str, set[str]] = {}
+        # Recently closed order_id -> final status, only kept for the debug
+        # log that tells repeated cancels apart from unknown ids (bounded)
+        self._closed: dict[str, str] = {}
+
+        # Active (open) orders only: symbol -> {order_id: OrderRecord}, in
+        # submission order. Orders leave on fill-to-zero or cancel, so BBO
+        # handling never visits closed orders.
+        self._open_by_symbol: dict[str, dict[str, OrderRecord]] = {}
 
         # Positions: symbol -> Position
         self._positions: dict[str, Position] = {}
 
+        self._log_info = is_level_enabled(log, logging.INFO)
+        self._log_debug = is_debug_enabled(log)
+
     def subscriptions(self):
         return [
             ("order.submitted", self._on_order_submitted),
@@ -82,19 +103,26 @@ class PaperExecutionAdapter:
     # ---------------- Handlers ----------------
 
     def _on_bbo(self, e: Event) -> None:
-        if not isinstance(e, BestBidAskUpdate):
+        if __debug__ and not isinstance(e, BestBidAskUpdate):
             return
 
-        self._bbo_by_symbol[e.symbol] = e
+        sym = e.symbol
+        self._bbo_by_symbol[sym] = e
 
-        for oid in tuple(self._orders_by_symbol.get(e.symbol, ())):
-            rec = self._orders.get(oid)
-            if rec is None or rec.status != "open":
-                continue
-            self._try_fill(rec)
+        active = self._open_by_symbol.get(sym)
+        if not active:
+            return
+
+        # Decide all resting orders against this BBO in one pass. decide_batch
+        # returns a list before any fill mutates `active`, so the live view is
+        # passed without a snapshot copy.
+        for rec, decision in decide_batch(self._fill_model, orders=active.values(), bbo=e):
+            # A fill published earlier in this loop may have led to a cancel
+            if rec.status == "open":
+                self._execute_fill(rec, decision)
 
     def _on_order_submitted(self, e: Event) -> None:
-        if not isinstance(e, OrderSubmitted):
+        if __debug__ and not isinstance(e, OrderSubmitted):
             return
 
         # Risk gate first (reserve exposure deterministically)
@@ -114,13 +142,14 @@ class PaperExecutionAdapter:
                     sequence=self._state.next_sequence(),
                 )
             )
-            log.info(
-                "paper.rejected",
-                run_id=self._state.run_id,
-                symbol=e.symbol,
-                order_id=e.order_id,
-                reason=rc.reason,
-            )
+            if self._log_info:
+                log.info(
+                    "paper.rejected",
+                    run_id=self._state.run_id,
+                    symbol=e.symbol,
+                    order_id=e.order_id,
+                    reason=rc.reason,
+                )
             return
 
         # Accept immediately (paper venue)
@@ -134,7 +163,10 @@ class PaperExecutionAdapter:
             status="open",
         )
         self._orders[e.order_id] = rec
-        self._orders_by_symbol.setdefault(e.symbol, set()).add(e.order_id)
+        active = self._open_by_symbol.get(e.symbol)
+        if active is None:
+            active = self._open_by_symbol[e.symbol] = {}
+        active[e.order_id] = rec
 
         self._bus.publish(
             OrderAccepted.create(
@@ -149,41 +181,44 @@ class PaperExecutionAdapter:
             self._try_fill(rec)
 
     def _on_cancel_requested(self, e: Event) -> None:
-        if not isinstance(e, OrderCancelRequested):
+        if __debug__ and not isinstance(e, OrderCancelRequested):
             return
 
+        # Unknown and already-terminal orders both miss here
         rec = self._orders.get(e.order_id)
         if rec is None:
-            log.debug(
-                "paper.cancel_ignored_missing",
-                run_id=self._state.run_id,
-                symbol=e.symbol,
-                order_id=e.order_id,
-            )
+            if self._log_debug:
+                status = self._closed.get(e.order_id)
+                if status is None:
+                    log.debug(
+                        "paper.cancel_ignored_missing",
+                        run_id=self._state.run_id,
+                        symbol=e.symbol,
+                        order_id=e.order_id,
+                    )
+                else:
+                    log.debug(
+                        "paper.cancel_ignored_not_open",
+                        run_id=self._state.run_id,
+                        symbol=e.symbol,
+                        order_id=e.order_id,
+                        status=status,
+                    )
             return
 
         if rec.symbol != e.symbol:
-            log.debug(
-                "paper.cancel_ignored_symbol_mismatch",
-                run_id=self._state.run_id,
-                event_symbol=e.symbol,
-                order_symbol=rec.symbol,
-                order_id=e.order_id,
-            )
-            return
-
-        if rec.status != "open":
-            log.debug(
-                "paper.cancel_ignored_not_open",
-                run_id=self._state.run_id,
-                symbol=e.symbol,
-                order_id=e.order_id,
-                status=rec.status,
-            )
+            if self._log_debug:
+                log.debug(
+                    "paper.cancel_ignored_symbol_mismatch",
+                    run_id=self._state.run_id,
+                    event_symbol=e.symbol,
+                    order_symbol=rec.symbol,
+                    order_id=e.order_id,
+                )
             return
 
         rec.cancel()
-        self._orders_by_symbol.get(rec.symbol, set()).discard(rec.order_id)
+        self._discard_open(rec)
 
         # Release reserved exposure
         self._risk.on_cancel(order_id=e.order_id)
@@ -196,12 +231,13 @@ class PaperExecutionAdapter:
             )
         )
 
-        log.info(
-            "paper.canceled",
-            run_id=self._state.run_id,
-            symbol=e.symbol,
-            order_id=e.order_id,
-        )
+        if self._log_info:
+            log.info(
+                "paper.canceled",
+                run_id=self._state.run_id,
+                symbol=e.symbol,
+                order_id=e.order_id,
+            )
 
     # ---------------- Fill model ----------------
 
@@ -216,38 +252,41 @@ class PaperExecutionAdapter:
         decision = self._fill_model.decide(order=order, bbo=bbo)
         if not decision.executable:
             return
+        self._execute_fill(order, decision)
 
+    def _execute_fill(self, order: OrderRecord, decision: FillDecision) -> None:
         assert decision.fill_price is not None, "FillModel returned executable without fill_price"
         assert decision.fill_qty is not None, "FillModel returned executable without fill_qty"
 
         fill_price = decision.fill_price
         fill_qty = decision.fill_qty
+        sym = order.symbol
+        side = order.side
 
         order.apply_fill(fill_qty=fill_qty)
 
         # Update position
-        pos = self._positions.get(order.symbol)
+        pos = self._positions.get(sym)
         if pos is None:
-            pos = Position(symbol=order.symbol)
-            self._positions[order.symbol] = pos
-        pos.on_fill(side=order.side, qty=fill_qty, price=fill_price)
+            pos = self._positions[sym] = Position(symbol=sym)
+        pos.on_fill(side=side, qty=fill_qty, price=fill_price)
 
         # Update risk inventory (tie to order_id so reservations are released)
         self._risk.on_fill(
-            symbol=order.symbol,
-            side=order.side,
+            symbol=sym,
+            side=side,
             qty=fill_qty,
             order_id=order.order_id,
         )
 
         if order.status != "open":
-            self._orders_by_symbol.get(order.symbol, set()).discard(order.order_id)
+            self._discard_open(order)
 
         self._bus.publish(
             Fill.create(
-                symbol=order.symbol,
+                symbol=sym,
                 order_id=order.order_id,
-                side=order.side,
+                side=side,
                 fill_price=fill_price,
                 fill_quantity=fill_qty,
                 remaining_quantity=order.remaining,
@@ -255,14 +294,27 @@ class PaperExecutionAdapter:
             )
         )
 
-        log.info(
-            "paper.fill",
-            run_id=self._state.run_id,
-            symbol=order.symbol,
-            order_id=order.order_id,
-            side=order.side,
-            fill_price=fill_price,
-            fill_qty=fill_qty,
-            remaining=order.remaining,
-            inventory=pos.inventory,
-        )
+        if self._log_info:
+            log.info(
+                "paper.fill",
+                run_id=self._state.run_id,
+                symbol=sym,
+                order_id=order.order_id,
+                side=side,
+                fill_price=fill_price,
+                fill_qty=fill_qty,
+                remaining=order.remaining,
+                inventory=pos.inventory,
+            )
+
+    def _discard_open(self, order: OrderRecord) -> None:
+        del self._orders[order.order_id]
+        if self._log_debug:
+            closed = self._closed
+            closed[order.order_id] = order.status
+            if len(closed) > _CLOSED_IDS_MAX:
+                # Evict oldest insertion
+                del closed[next(iter(closed))]
+        active = self._open_by_symbol.get(order.symbol)
+        if active is not None:
+            active.pop(order.order_id, None)
@@ -6,6 +6,7 @@ from mmrl.core.engine.state import EngineState
 from mmrl.core.events.base import Event
 from mmrl.core.events.bus import EventBus
 from mmrl.core.events.marketdata import BestBidAskUpdate, OrderBookLevelUpdate
+from mmrl.core.logging.setup import is_debug_enabled
 from mmrl.marketdata.orderbook.book import OrderBook
 
 log = structlog.get_logger()
@@ -38,6 +39,8 @@ class OrderBookComponent:
             float | None,
         ] | None = None
 
+        self._log_debug = is_debug_enabled(log)
+
     @property
     def book(self) -> OrderBook:
         return self._book
@@ -46,13 +49,15 @@ class OrderBookComponent:
         return [("market.order_book_level", self._on_l2)]
 
     def _on_l2(self, e: Event) -> None:
-        if not isinstance(e, OrderBookLevelUpdate):
+        # Debug-only guard: the bus only routes OrderBookLevelUpdate here
+        if __debug__ and not isinstance(e, OrderBookLevelUpdate):
             return
         if e.symbol != self._book.symbol:
             return
 
-        # Apply update to book
-        self._book.apply_level_update(e)
+        # Apply update to book; deltas behind the top cannot change the BBO
+        if not self._book.apply_level_update(e):
+            return
 
         best = self._book.best()
         now = (
@@ -78,9 +83,10 @@ class OrderBookComponent:
         )
         self._bus.publish(bbo)
 
-        log.debug(
-            "orderbook.bbo_emitted",
-            run_id=self._state.run_id,
-            symbol=self._book.symbol,
-            sequence=seq,
-        )
+        if self._log_debug:
+            log.debug(
+                "orderbook.bbo_emitted",
+                run_id=self._state.run_id,
+                symbol=self._book.symbol,
+                sequence=seq,
+            )
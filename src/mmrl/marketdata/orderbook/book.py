@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import sys
+from bisect import bisect_left, insort
 from dataclasses import dataclass
 from typing import Iterable
 
@@ -21,6 +23,8 @@ class OrderBook:
     Maintains:
       - bids: price -> size
       - asks: price -> size
+      - a sorted (ascending) price index per side, so best price is a list end
+        and top-N is a slice instead of a scan/sort of the whole side
 
     Conventions:
       - size == 0 => remove level
@@ -29,37 +33,65 @@ class OrderBook:
     """
 
     def __init__(self, *, symbol: str) -> None:
-        self.symbol = symbol
+        # Interned like replay/normalized deltas and strategy configs, so the
+        # per-update symbol check (and the BBO events it emits) compare by identity
+        self.symbol = sys.intern(symbol)
         self._bids: dict[float, float] = {}
         self._asks: dict[float, float] = {}
+        self._bid_prices: list[float] = []
+        self._ask_prices: list[float] = []
 
         self._best_bid: float | None = None
         self._best_ask: float | None = None
 
     # ---------- Public API ----------
 
-    def apply_level_update(self, u: OrderBookLevelUpdate) -> None:
+    def apply_level_update(self, u: OrderBookLevelUpdate) -> bool:
+        """
+        Apply one L2 delta.
+
+        Returns True if top-of-book (best price or the size at it) may have
+        changed on the updated side; False for updates strictly behind the top.
+        """
         if u.symbol != self.symbol:
             raise ValueError(f"update symbol mismatch: {u.symbol} != {self.symbol}")
-        if u.price <= 0:
-            raise ValueError("price must be > 0")
-        if u.size < 0:
-            raise ValueError("size must be >= 0")
 
         side = u.side
         price = u.price
         size = u.size
 
+        # Producers validate values (OrderBookDelta.validate); re-checked only
+        # in debug builds. A symbol mismatch is a routing bug: always checked.
+        if __debug__:
+            if price <= 0:
+                raise ValueError("price must be > 0")
+            if size < 0:
+                raise ValueError("size must be >= 0")
+
+        # Best price can only move when a level is added or removed; size
+        # changes on an existing level (the common case) leave it as is
         if side == "bid":
-            self._apply(self._bids, price, size, is_bid=True)
+            best = self._best_bid
+            if self._apply(self._bids, self._bid_prices, price, size):
+                self._best_bid = self._bid_prices[-1] if self._bid_prices else None
+                top_changed = self._best_bid != best
+            else:
+                top_changed = price == best
         else:
-            self._apply(self._asks, price, size, is_bid=False)
+            best = self._best_ask
+            if self._apply(self._asks, self._ask_prices, price, size):
+                self._best_ask = self._ask_prices[0] if self._ask_prices else None
+                top_changed = self._best_ask != best
+            else:
+                top_changed = price == best
 
         # Optional: enforce no-cross (best_bid <= best_ask) if both exist.
         # Real feeds can momentarily cross depending on update ordering.
         # We'll keep it permissive for now; strategy/execution can handle.
         # (We will add optional strict mode later.)
 
+        return top_changed
+
     def best(self) -> BestBidAsk:
         bid = self._best_bid
         ask = self._best_ask
@@ -79,15 +111,13 @@ class OrderBook:
         if side not in ("bid", "ask"):
             raise ValueError("side must be 'bid' or 'ask'")
 
-        book = self._bids if side == "bid" else self._asks
-        if not book:
-            return []
-
-        prices = sorted(book.keys(), reverse=(side == "bid"))
-        out: list[tuple[float, float]] = []
-        for p in prices[:depth]:
-            out.append((p, book[p]))
-        return out
+        if side == "bid":
+            book = self._bids
+            prices = self._bid_prices[: -depth - 1 : -1]
+        else:
+            book = self._asks
+            prices = self._ask_prices[:depth]
+        return [(p, book[p]) for p in prices]
 
     def levels(self, *, side: str) -> Iterable[tuple[float, float]]:
         """
@@ -95,23 +125,33 @@ class OrderBook:
         """
         if side not in ("bid", "ask"):
             raise ValueError("side must be 'bid' or 'ask'")
-        book = self._bids if side == "bid" else self._asks
-        prices = sorted(book.keys(), reverse=(side == "bid"))
+        if side == "bid":
+            book = self._bids
+            prices = self._bid_prices[::-1]
+        else:
+            book = self._asks
+            prices = self._ask_prices[:]
         for p in prices:
             yield p, book[p]
 
     # ---------- Internal helpers ----------
 
-    def _apply(self, book: dict[float, float], price: float, size: float, *, is_bid: bool) -> None:
-        # update/remove
-        if size == 0.0:
-            if price in book:
-                del book[price]
-        else:
-            book[price] = size
+    @staticmethod
+    def _apply(book: dict[float, float], prices: list[float], price: float, size: float) -> bool:
+        """
+        Update/remove a level, keeping the sorted price index in step with the map.
 
-        # refresh best price only when needed (simple + correct)
-        if is_bid:
-            self._best_bid = max(book.keys()) if book else None
-        else:
-            self._best_ask = min(book.keys()) if book else None
+        Returns True if the set of price levels changed.
+        """
+        if size == 0.0:
+            if price not in book:
+                return False
+            del book[price]
+            del prices[bisect_left(prices, price)]
+            return True
+
+        added = price not in book
+        if added:
+            insort(prices, price)
+        book[price] = size
+        return added
@@ -32,10 +32,14 @@ class OrderBookDelta:
         if not self.symbol:
             raise ValueError("symbol must be non-empty")
 
-        for u in self.bid_updates:
-            _validate_level(u)
-        for u in self.ask_updates:
-            _validate_level(u)
+        for updates in (self.bid_updates, self.ask_updates):
+            for u in updates:
+                price = u.price
+                size = u.size
+                if price <= 0:
+                    raise ValueError("price must be > 0")
+                if size < 0:
+                    raise ValueError("size must be >= 0")
 
     def to_events(self, *, start_sequence: int) -> list[OrderBookLevelUpdate]:
         """
@@ -48,38 +52,21 @@ class OrderBookDelta:
 
         self.validate()
 
-        seq = start_sequence
-        out: list[OrderBookLevelUpdate] = []
-
-        for u in self.bid_updates:
-            seq += 1
-            out.append(
-                OrderBookLevelUpdate.create(
-                    symbol=self.symbol,
-                    side="bid",
-                    price=u.price,
-                    size=u.size,
-                    sequence=seq,
-                )
-            )
-
-        for u in self.ask_updates:
-            seq += 1
-            out.append(
-                OrderBookLevelUpdate.create(
-                    symbol=self.symbol,
-                    side="ask",
-                    price=u.price,
-                    size=u.size,
-                    sequence=seq,
-                )
-            )
-
+        bids = self.bid_updates
+        asks = self.ask_updates
+
+        out = OrderBookLevelUpdate.create_many(
+            symbol=self.symbol,
+            side="bid",
+            prices=[u.price for u in bids],
+            sizes=[u.size for u in bids],
+            first_sequence=start_sequence + 1,
+        )
+        out += OrderBookLevelUpdate.create_many(
+            symbol=self.symbol,
+            side="ask",
+            prices=[u.price for u in asks],
+            sizes=[u.size for u in asks],
+            first_sequence=start_sequence + 1 + len(bids),
+        )
         return out
-
-
-def _validate_level(u: LevelUpdate) -> None:
-    if u.price <= 0:
-        raise ValueError("price must be > 0")
-    if u.size < 0:
-        raise ValueError("size must be >= 0")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, Iterable, Sequence
+import sys
+from typing import Any, Sequence
 
 from mmrl.marketdata.orderbook.delta import LevelUpdate, OrderBookDelta
 
@@ -24,19 +25,29 @@ def normalize_l2_delta(
     """
     if not symbol:
         raise ValueError("symbol must be non-empty")
+    # One shared str object per symbol: downstream symbol checks hit identity
+    symbol = sys.intern(symbol)
 
-    bid_updates = tuple(_parse_levels(bids))
-    ask_updates = tuple(_parse_levels(asks))
+    bid_updates = _parse_levels(bids)
+    ask_updates = _parse_levels(asks)
 
     d = OrderBookDelta(symbol=symbol, bid_updates=bid_updates, ask_updates=ask_updates)
     d.validate()
     return d
 
 
-def _parse_levels(rows: Sequence[Any]) -> Iterable[LevelUpdate]:
+def _parse_levels(rows: Sequence[Any]) -> tuple[LevelUpdate, ...]:
+    out: list[LevelUpdate] = []
+    append = out.append
     for r in rows:
-        price, size = _parse_row(r)
-        yield LevelUpdate(price=price, size=size)
+        # [price, size] pairs are the common feed shape: parsed inline, other
+        # shapes (and errors) go through _parse_row
+        if isinstance(r, (list, tuple)) and len(r) == 2:
+            append(LevelUpdate(price=float(r[0]), size=float(r[1])))
+        else:
+            price, size = _parse_row(r)
+            append(LevelUpdate(price=price, size=size))
+    return tuple(out)
 
 
 def _parse_row(row: Any) -> tuple[float, float]:
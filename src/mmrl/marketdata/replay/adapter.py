@@ -54,32 +54,29 @@ class ReplayMarketDataAdapter:
             log.info("replay.exhausted", run_id=self._state.run_id, tick=tick)
             return
 
-        # Use engine's global sequence to ensure deterministic ordering across all events
-        # Allocate deterministic sequences through EngineState
-        events = []
-        for u in delta.bid_updates:
-            events.append(
-                OrderBookLevelUpdate.create(
-                    symbol=delta.symbol,
-                    side="bid",
-                    price=u.price,
-                    size=u.size,
-                    sequence=self._state.next_sequence(),
-                )
-            )
-        for u in delta.ask_updates:
-            events.append(
-                OrderBookLevelUpdate.create(
-                    symbol=delta.symbol,
-                    side="ask",
-                    price=u.price,
-                    size=u.size,
-                    sequence=self._state.next_sequence(),
-                )
-            )
+        # Use engine's global sequence to ensure deterministic ordering across all events.
+        # All updates of a delta are published as one batch: allocate their
+        # sequences contiguously through EngineState in a single call, and
+        # build each side with symbol/side fixed (create_many).
+        bids = delta.bid_updates
+        asks = delta.ask_updates
+        first = self._state.next_sequence_range(len(bids) + len(asks)).start
+        events = OrderBookLevelUpdate.create_many(
+            symbol=delta.symbol,
+            side="bid",
+            prices=[u.price for u in bids],
+            sizes=[u.size for u in bids],
+            first_sequence=first,
+        )
+        events += OrderBookLevelUpdate.create_many(
+            symbol=delta.symbol,
+            side="ask",
+            prices=[u.price for u in asks],
+            sizes=[u.size for u in asks],
+            first_sequence=first + len(bids),
+        )
 
-        for evt in events:
-            self._bus.publish(evt)
+        self._bus.publish_many(events)
 
         log.debug(
             "replay.delta_published",
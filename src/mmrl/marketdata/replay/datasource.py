@@ -15,7 +15,7 @@ class ReplayDataSource(Protocol):
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InMemoryReplayDataSource:
     """
     Simple in-memory datasource for tests and early demos.
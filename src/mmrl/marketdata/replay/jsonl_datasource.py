@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-import json
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterator
 
+import orjson
+
 from mmrl.marketdata.orderbook.delta import LevelUpdate, OrderBookDelta
 
+# Replay files are read sequentially end to end: one large buffer means few
+# read() syscalls per file
+_READ_BUFFER = 1 << 20
+
 
 @dataclass(frozen=True, slots=True)
 class JsonlReplayDataSource:
@@ -17,19 +23,26 @@ class JsonlReplayDataSource:
       {"symbol":"BTCUSDT","bid_updates":[[price,size],...],"ask_updates":[[price,size],...]}
 
     Order preserved. Blank lines ignored.
+
+    validate=False skips per-level value checks (price > 0, size >= 0) for
+    trusted files, e.g. ones written by our own recorder. Structural checks
+    (symbol, list shapes) always run.
     """
     path: Path
+    validate: bool = True
 
     def __iter__(self) -> Iterator[OrderBookDelta]:
-        with self.path.open("r", encoding="utf-8") as f:
+        # Binary mode: orjson parses (and UTF-8 validates) bytes directly, so
+        # lines are never decoded to str first. orjson skips the surrounding
+        # whitespace itself: blank lines are detected without a stripped copy.
+        with self.path.open("rb", buffering=_READ_BUFFER) as f:
             for line_no, line in enumerate(f, start=1):
-                s = line.strip()
-                if not s:
+                if line.isspace():
                     continue
 
                 try:
-                    obj = json.loads(s)
-                except json.JSONDecodeError as e:
+                    obj = orjson.loads(line)
+                except orjson.JSONDecodeError as e:
                     raise ValueError(f"invalid JSON on line {line_no}: {e}") from e
 
                 symbol = obj.get("symbol")
@@ -44,6 +57,10 @@ class JsonlReplayDataSource:
                 bid_updates = tuple(LevelUpdate(price=float(p), size=float(sz)) for p, sz in bids)
                 ask_updates = tuple(LevelUpdate(price=float(p), size=float(sz)) for p, sz in asks)
 
+                # One shared str object per symbol across the whole replay
+                symbol = sys.intern(symbol)
+
                 delta = OrderBookDelta(symbol=symbol, bid_updates=bid_updates, ask_updates=ask_updates)
-                delta.validate()
+                if self.validate:
+                    delta.validate()
                 yield delta
@@ -1,28 +1,55 @@
 # src/mmrl/storage/jsonl.py
 from __future__ import annotations
 
-import json
 import os
-from dataclasses import asdict, is_dataclass
+import time
+from dataclasses import fields, is_dataclass
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, BinaryIO, Iterator, Mapping
+
+import orjson
 
 from mmrl.core.events.base import Event
 
+_ORJSON_OPTS = orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
+# Datetimes go through default=str, keeping the events.jsonl timestamp format
+# ("YYYY-MM-DD HH:MM:SS.ffffff+00:00") that json.dumps(default=str) produced
+_EVENT_OPTS = _ORJSON_OPTS | orjson.OPT_PASSTHROUGH_DATETIME
+
 
 class JsonlEventStore:
     """
     Append-only JSONL event store.
 
-    - One event per line (JSON dict).
-    - fsync on demand for crash safety.
+    - One event per line (JSON dict, keys sorted).
+    - Lines are serialized straight to bytes (orjson) into an in-memory buffer
+      and written in large sequential chunks once `buffer_bytes` is reached.
+    - flush() drains the buffer (and fsyncs when fsync=True); callers flush at
+      run boundaries. close() flushes too.
     - Deterministic: preserves publish order as written.
+
+    Durability tradeoff: appends are no longer fsynced one by one. An append
+    also flushes once `flush_interval_s` has passed since the last flush, so a
+    crash loses at most `buffer_bytes` of lines, none older than
+    `flush_interval_s` while appends keep arriving. flush_interval_s=0 restores
+    per-append flush + fsync.
     """
 
-    def __init__(self, *, path: Path, fsync: bool = True) -> None:
+    def __init__(
+        self,
+        *,
+        path: Path,
+        fsync: bool = True,
+        buffer_bytes: int = 64 * 1024,
+        flush_interval_s: float = 1.0,
+    ) -> None:
         self._path = path
         self._fsync = fsync
-        self._fh = None  # lazy open
+        self._buffer_bytes = buffer_bytes
+        self._flush_interval_s = flush_interval_s
+        self._last_flush = time.monotonic()
+        self._buf = bytearray()
+        self._fh: BinaryIO | None = None  # lazy open
 
         # Ensure parent exists
         self._path.parent.mkdir(parents=True, exist_ok=True)
@@ -34,64 +61,126 @@ class JsonlEventStore:
     def open(self) -> None:
         if self._fh is not None:
             return
-        # line-buffered text mode
-        self._fh = self._path.open("a", encoding="utf-8", buffering=1)
+        # unbuffered binary: our own bytearray is the (only) buffer
+        self._fh = self._path.open("ab", buffering=0)
+
+    def flush(self) -> None:
+        """
+        Write buffered lines to the file; fsync if this store is durable.
+        """
+        if self._buf:
+            self.open()
+            assert self._fh is not None
+            self._fh.write(self._buf)
+            self._buf.clear()
+        if self._fsync and self._fh is not None:
+            os.fsync(self._fh.fileno())
+        self._last_flush = time.monotonic()
 
     def close(self) -> None:
-        if self._fh is None:
+        if self._fh is None and not self._buf:
             return
         try:
-            self._fh.flush()
-            if self._fsync:
-                os.fsync(self._fh.fileno())
+            self.flush()
         finally:
-            self._fh.close()
-            self._fh = None
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
 
     def append(self, event: Event) -> None:
         """
-        Append an event as a single JSON line.
+        Append an event as a single JSON line (buffered).
 
         Serialization rules:
-        - dataclasses -> asdict
-        - UUID/datetime -> str via default=str
+        - all dataclass fields + event_type
+        - UUID -> str (orjson native), datetime -> str()
         """
-        self.open()
-        assert self._fh is not None
-
-        payload = _event_to_dict(event)
-        line = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
-        self._fh.write(line + "\n")
-        self._fh.flush()
-        if self._fsync:
-            os.fsync(self._fh.fileno())
-
-    def iter_events(self) -> list[Mapping[str, Any]]:
+        buf = self._buf
+        buf += orjson.dumps(_event_to_dict(event), default=str, option=_EVENT_OPTS)
+        if len(buf) >= self._buffer_bytes:
+            self.open()
+            assert self._fh is not None
+            self._fh.write(buf)
+            buf.clear()
+        if time.monotonic() - self._last_flush >= self._flush_interval_s:
+            self.flush()
+
+    def iter_events(self) -> Iterator[Mapping[str, Any]]:
         """
-        Read all events as dicts (useful for quick diagnostics/tests).
+        Stream stored events as dicts, in file order (constant memory).
 
-        For a true replay engine we’ll stream this generator-style,
-        but keeping it simple + deterministic here.
+        Buffered lines are flushed when iteration starts; use
+        list(store.iter_events()) where a materialized list is needed.
         """
+        # Make buffered lines visible to the reader
+        if self._buf:
+            self.flush()
         if not self._path.exists():
-            return []
-        out: list[Mapping[str, Any]] = []
-        with self._path.open("r", encoding="utf-8") as fh:
+            return
+        with self._path.open("rb") as fh:
             for line in fh:
-                s = line.strip()
-                if not s:
+                if line.isspace():
                     continue
-                out.append(json.loads(s))
-        return out
+                yield orjson.loads(line)
+
+
+class JsonlWriter:
+    """
+    Append-only JSONL writer for plain dict payloads.
+
+    Holds a single buffered binary handle for its lifetime (opened lazily on
+    first append); lines are serialized straight to bytes (orjson, keys
+    sorted). Call flush()/close() at run boundaries.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._fh: BinaryIO | None = None
+
+        # Ensure parent exists
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def append(self, payload: Mapping[str, Any]) -> None:
+        fh = self._fh
+        if fh is None:
+            fh = self._fh = self._path.open("ab")
+        fh.write(orjson.dumps(payload, default=str, option=_ORJSON_OPTS))
+
+    def flush(self) -> None:
+        if self._fh is not None:
+            self._fh.flush()
+
+    def close(self) -> None:
+        if self._fh is None:
+            return
+        try:
+            self._fh.flush()
+        finally:
+            self._fh.close()
+            self._fh = None
+
+
+# Event class -> dataclass field names, resolved once per class
+_FIELDS_CACHE: dict[type, tuple[str, ...]] = {}
 
 
 def _event_to_dict(event: Event) -> dict[str, Any]:
     # All events are dataclasses in this project
-    if is_dataclass(event):
-        d = asdict(event)
-    else:
-        # fallback: best-effort
-        d = dict(event.__dict__)
+    cls = type(event)
+    names = _FIELDS_CACHE.get(cls)
+    if names is None:
+        if is_dataclass(event):
+            names = tuple(f.name for f in fields(event))
+        else:
+            # fallback: best-effort
+            names = tuple(event.__dict__)
+        _FIELDS_CACHE[cls] = names
+
+    d = {name: getattr(event, name) for name in names}
 
     # Ensure event_type is always present even though it's ClassVar
     d["event_type"] = event.event_type
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import hashlib
+import logging
+import struct
+import sys
 from dataclasses import dataclass
 
 import structlog
@@ -10,10 +13,15 @@ from mmrl.core.events.base import Event
 from mmrl.core.events.bus import EventBus
 from mmrl.core.events.marketdata import BestBidAskUpdate
 from mmrl.core.events.orders import Fill, OrderCanceled, OrderCancelRequested, OrderSubmitted
+from mmrl.core.logging.setup import is_debug_enabled, is_level_enabled
 from mmrl.strategies.base import Strategy
 
 log = structlog.get_logger()
 
+# Order-id payload after the run_id prefix: tick, is_buy, price, qty. Floats
+# go in as their exact IEEE-754 bits (no decimal formatting per quote).
+_OID_FIELDS = struct.Struct("<q?dd")
+
 
 @dataclass(frozen=True, slots=True)
 class FixedSpreadConfig:
@@ -31,6 +39,11 @@ class FixedSpreadConfig:
     min_mid_move: float = 0.0  # only requote if mid moved more than this
     min_ticks_between_quotes: int = 1
 
+    def __post_init__(self) -> None:
+        # Interned so the per-event `e.symbol != cfg.symbol` filter compares
+        # by identity against interned book/replay symbols
+        object.__setattr__(self, "symbol", sys.intern(self.symbol))
+
 
 class FixedSpreadMarketMaker(Strategy):
     """
@@ -63,9 +76,17 @@ class FixedSpreadMarketMaker(Strategy):
         self._state = state
         self._cfg = cfg
 
+        # cfg is frozen: derived quoting constants are computed once
+        self._half_spread = cfg.spread / 2.0
+
+        # run_id is fixed for the strategy's lifetime: encode the id prefix once
+        self._oid_prefix = f"{state.run_id}|".encode("utf-8")
+
         self._inventory: float = 0.0
         self._last_mid: float | None = None
         self._last_quote_tick: int = -10**9
+        # Inventory the current quotes were computed for (see _on_bbo idle exit)
+        self._last_inv_at_quote: float = 0.0
 
         # Active quote tracking (cancel/replace)
         self._active_bid_id: str | None = None
@@ -78,6 +99,9 @@ class FixedSpreadMarketMaker(Strategy):
         self._pending_bid: tuple[float, float] | None = None  # (price, qty)
         self._pending_ask: tuple[float, float] | None = None  # (price, qty)
 
+        self._log_info = is_level_enabled(log, logging.INFO)
+        self._log_debug = is_debug_enabled(log)
+
     def subscriptions(self):
         return [
             ("market.best_bid_ask", self._on_bbo),
@@ -89,7 +113,8 @@ class FixedSpreadMarketMaker(Strategy):
 
     def _assert_invariants(self) -> None:
         """
-        Brutal correctness checks.
+        Brutal correctness checks (debug builds only: call sites are guarded
+        by __debug__, so python -O skips the call entirely).
 
         Invariants:
           - At most one active order per side is tracked.
@@ -100,16 +125,10 @@ class FixedSpreadMarketMaker(Strategy):
         if self._pending_ask is not None:
             assert self._active_ask_id is not None, "pending ask without active ask"
 
-    @staticmethod
-    def _same_price(a: float | None, b: float | None, eps: float) -> bool:
-        if a is None or b is None:
-            return False
-        return abs(a - b) <= eps
-
     # ---------------- Event handlers ----------------
 
     def _on_fill(self, e: Event) -> None:
-        if not isinstance(e, Fill):
+        if __debug__ and not isinstance(e, Fill):
             return
         if e.symbol != self._cfg.symbol:
             return
@@ -123,26 +142,28 @@ class FixedSpreadMarketMaker(Strategy):
             self._active_bid_id = None
             self._active_bid_price = None
             self._pending_bid = None
-
-        if self._active_ask_id == e.order_id:
+        # Order ids are unique per side: a bid match can't also be the ask
+        elif self._active_ask_id == e.order_id:
             self._active_ask_id = None
             self._active_ask_price = None
             self._pending_ask = None
 
-        log.info(
-            "strategy.inventory_updated",
-            run_id=self._state.run_id,
-            symbol=e.symbol,
-            side=e.side,
-            fill_qty=e.fill_quantity,
-            fill_price=e.fill_price,
-            inventory=self._inventory,
-        )
+        if self._log_info:
+            log.info(
+                "strategy.inventory_updated",
+                run_id=self._state.run_id,
+                symbol=e.symbol,
+                side=e.side,
+                fill_qty=e.fill_quantity,
+                fill_price=e.fill_price,
+                inventory=self._inventory,
+            )
 
-        self._assert_invariants()
+        if __debug__:
+            self._assert_invariants()
 
     def _on_canceled(self, e: Event) -> None:
-        if not isinstance(e, OrderCanceled):
+        if __debug__ and not isinstance(e, OrderCanceled):
             return
         if e.symbol != self._cfg.symbol:
             return
@@ -160,9 +181,9 @@ class FixedSpreadMarketMaker(Strategy):
                 self._active_bid_id = o.order_id
                 self._active_bid_price = price
                 self._bus.publish(o)
-
-        # Ask cancel ack → submit pending ask replacement (if any)
-        if self._active_ask_id == e.order_id:
+        # Ask cancel ack → submit pending ask replacement (if any). elif: order
+        # ids are unique per side, so a bid ack can't also be the ask's.
+        elif self._active_ask_id == e.order_id:
             self._active_ask_id = None
             self._active_ask_price = None
 
@@ -175,19 +196,22 @@ class FixedSpreadMarketMaker(Strategy):
                 self._active_ask_price = price
                 self._bus.publish(o)
 
-        log.debug(
-            "strategy.cancel_ack",
-            run_id=self._state.run_id,
-            symbol=e.symbol,
-            order_id=e.order_id,
-        )
+        if self._log_debug:
+            log.debug(
+                "strategy.cancel_ack",
+                run_id=self._state.run_id,
+                symbol=e.symbol,
+                order_id=e.order_id,
+            )
 
-        self._assert_invariants()
+        if __debug__:
+            self._assert_invariants()
 
     def _on_bbo(self, e: Event) -> None:
-        if not isinstance(e, BestBidAskUpdate):
+        if __debug__ and not isinstance(e, BestBidAskUpdate):
             return
-        if e.symbol != self._cfg.symbol:
+        cfg = self._cfg
+        if e.symbol != cfg.symbol:
             return
 
         bid = e.bid_price
@@ -198,36 +222,61 @@ class FixedSpreadMarketMaker(Strategy):
         mid = (bid + ask) / 2.0
 
         # Throttle quotes to avoid spamming
-        if (self._state.tick - self._last_quote_tick) < self._cfg.min_ticks_between_quotes:
+        tick = self._state.tick
+        if (tick - self._last_quote_tick) < cfg.min_ticks_between_quotes:
             return
-        if self._last_mid is not None and abs(mid - self._last_mid) < self._cfg.min_mid_move:
+        last_mid = self._last_mid
+        if last_mid is not None and abs(mid - last_mid) < cfg.min_mid_move:
             return
 
         self._last_mid = mid
-        self._last_quote_tick = self._state.tick
+        self._last_quote_tick = tick
+
+        # Inventory is read before any publish below: an immediate fill
+        # dispatched from a publish updates it (and the active ids) re-entrantly
+        inventory = self._inventory
+
+        # Idle tick: quotes are a function of (mid, inventory) only. If both are
+        # unchanged and both sides rest with nothing staged, every need_new_*
+        # check below would be False, so skip recomputing them.
+        if (
+            mid == last_mid
+            and inventory == self._last_inv_at_quote
+            and self._active_bid_id is not None
+            and self._active_ask_id is not None
+            and self._pending_bid is None
+            and self._pending_ask is None
+        ):
+            return
+        self._last_inv_at_quote = inventory
 
         # Inventory skew: positive inventory pushes quotes down to encourage selling
-        skew = self._cfg.inventory_skew_k * self._inventory
+        skew = cfg.inventory_skew_k * inventory
 
-        half = self._cfg.spread / 2.0
+        half = self._half_spread
         bid_quote = mid - half - skew
         ask_quote = mid + half - skew
 
         # Clamp sizes based on inventory limits
-        buy_size = self._cfg.order_size
-        sell_size = self._cfg.order_size
+        buy_size = cfg.order_size
+        sell_size = cfg.order_size
 
-        if self._inventory >= self._cfg.max_inventory:
+        max_inventory = cfg.max_inventory
+        if inventory >= max_inventory:
             buy_size = 0.0
-        if self._inventory <= -self._cfg.max_inventory:
+        if inventory <= -max_inventory:
             sell_size = 0.0
 
+        # Same-price tolerance for the need_new_* checks (a NaN quote never matches)
+        eps = self._EPS
+
         # --- Bid quote (buy) ---
         if buy_size > 0:
+            active_price = self._active_bid_price
             need_new_bid = (
                 self._active_bid_id is None
-                or self._active_bid_price is None
-                or not self._same_price(bid_quote, self._active_bid_price, self._EPS)
+                or active_price is None
+                or not (-eps <= bid_quote - active_price <= eps)
             )
 
             if need_new_bid:
@@ -239,7 +288,7 @@ class FixedSpreadMarketMaker(Strategy):
                     self._pending_bid = (bid_quote, buy_size)
                     self._bus.publish(
                         OrderCancelRequested.create(
-                            symbol=self._cfg.symbol,
+                            symbol=cfg.symbol,
                             order_id=self._active_bid_id,
                             sequence=self._state.next_sequence(),
                         )
@@ -252,10 +301,11 @@ class FixedSpreadMarketMaker(Strategy):
 
         # --- Ask quote (sell) ---
         if sell_size > 0:
+            active_price = self._active_ask_price
             need_new_ask = (
                 self._active_ask_id is None
-                or self._active_ask_price is None
-                or not self._same_price(ask_quote, self._active_ask_price, self._EPS)
+                or active_price is None
+                or not (-eps <= ask_quote - active_price <= eps)
             )
 
             if need_new_ask:
@@ -266,7 +316,7 @@ class FixedSpreadMarketMaker(Strategy):
                     self._pending_ask = (ask_quote, sell_size)
                     self._bus.publish(
                         OrderCancelRequested.create(
-                            symbol=self._cfg.symbol,
+                            symbol=cfg.symbol,
                             order_id=self._active_ask_id,
                             sequence=self._state.next_sequence(),
                         )
@@ -277,21 +327,23 @@ class FixedSpreadMarketMaker(Strategy):
                     self._active_ask_price = ask_quote
                     self._bus.publish(o)
 
-        log.info(
-            "strategy.quoted",
-            run_id=self._state.run_id,
-            symbol=self._cfg.symbol,
-            mid=mid,
-            bid_quote=bid_quote,
-            ask_quote=ask_quote,
-            inventory=self._inventory,
-            active_bid_id=self._active_bid_id,
-            active_ask_id=self._active_ask_id,
-            pending_bid=self._pending_bid is not None,
-            pending_ask=self._pending_ask is not None,
-        )
+        if self._log_info:
+            log.info(
+                "strategy.quoted",
+                run_id=self._state.run_id,
+                symbol=cfg.symbol,
+                mid=mid,
+                bid_quote=bid_quote,
+                ask_quote=ask_quote,
+                inventory=self._inventory,
+                active_bid_id=self._active_bid_id,
+                active_ask_id=self._active_ask_id,
+                pending_bid=self._pending_bid is not None,
+                pending_ask=self._pending_ask is not None,
+            )
 
-        self._assert_invariants()
+        if __debug__:
+            self._assert_invariants()
 
     # ---------------- Helpers ----------------
 
@@ -300,10 +352,10 @@ class FixedSpreadMarketMaker(Strategy):
         Build a deterministic OrderSubmitted event.
 
         Order IDs are stable across replays:
-          sha1(run_id | tick | side | price | qty)[:16]
+          blake2b-64(run_id | pack(tick, is_buy, price, qty)), 16 hex chars
         """
-        payload = f"{self._state.run_id}|{self._state.tick}|{side}|{price:.8f}|{qty:.8f}"
-        oid = hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+        payload = self._oid_prefix + _OID_FIELDS.pack(self._state.tick, side == "buy", price, qty)
+        oid = hashlib.blake2b(payload, digest_size=8).hexdigest()
 
         return OrderSubmitted.create(
             symbol=self._cfg.symbol,
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import gc
+
+import pytest
+
+from mmrl.core.engine.engine import Engine
+from mmrl.core.events.base import Event
+from mmrl.core.events.bus import EventBus
+
+
+def _engine(seen: list[tuple[int, int, bool]]) -> Engine:
+    bus = EventBus()
+    bus.subscribe(event_type="system.engine_tick", handler=lambda e: seen.append((e.tick, e.sequence, gc.isenabled())))
+    return Engine(run_id="r1", bus=bus)
+
+
+def test_disable_gc_suspends_collection_only_inside_the_loop() -> None:
+    assert gc.isenabled()
+    seen: list[tuple[int, int, bool]] = []
+    _engine(seen).run(max_ticks=3, disable_gc=True)
+
+    assert gc.isenabled()
+    # RunStarted takes sequence 1; ticks follow contiguously
+    assert seen == [(1, 2, False), (2, 3, False), (3, 4, False)]
+
+
+def test_disable_gc_restores_gc_after_a_handler_error() -> None:
+    bus = EventBus()
+
+    def boom(e: Event) -> None:
+        raise RuntimeError("boom")
+
+    bus.subscribe(event_type="system.engine_tick", handler=boom)
+    with pytest.raises(RuntimeError):
+        Engine(run_id="r1", bus=bus).run(max_ticks=3, disable_gc=True)
+    assert gc.isenabled()
+
+
+def test_disable_gc_leaves_caller_managed_gc_alone() -> None:
+    gc.disable()
+    try:
+        seen: list[tuple[int, int, bool]] = []
+        _engine(seen).run(max_ticks=1, disable_gc=True)
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
+
+
+def test_default_run_keeps_gc_enabled() -> None:
+    seen: list[tuple[int, int, bool]] = []
+    _engine(seen).run(max_ticks=2)
+    assert [enabled for _, _, enabled in seen] == [True, True]
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import pytest
+
+from mmrl.core.engine.state import EngineState
+
+
+def _running() -> EngineState:
+    st = EngineState(run_id="r1")
+    st.is_running = True
+    return st
+
+
+def test_next_sequence_range_matches_repeated_next_sequence() -> None:
+    batched = _running()
+    single = _running()
+    batched.next_sequence()
+    single.next_sequence()
+
+    assert list(batched.next_sequence_range(3)) == [single.next_sequence() for _ in range(3)] == [2, 3, 4]
+    assert batched.sequence == single.sequence == 4
+
+    # Numbering continues contiguously after a batch
+    assert batched.next_sequence() == 5
+    assert list(batched.next_sequence_range(0)) == []
+    assert batched.sequence == 5
+
+
+def test_next_sequence_range_guards() -> None:
+    st = EngineState(run_id="r1")
+    with pytest.raises(RuntimeError):
+        st.next_sequence_range(2)
+
+    st.is_running = True
+    with pytest.raises(ValueError):
+        st.next_sequence_range(-1)
+    assert st.sequence == 0
+
+
+def test_next_step_matches_next_tick_then_next_sequence() -> None:
+    stepped = _running()
+    single = _running()
+    stepped.next_sequence_range(2)
+    single.next_sequence_range(2)
+
+    for _ in range(3):
+        assert stepped.next_step() == (single.next_tick(), single.next_sequence())
+    assert (stepped.tick, stepped.sequence) == (single.tick, single.sequence) == (3, 5)
+
+
+def test_next_step_requires_running_engine() -> None:
+    st = EngineState(run_id="r1")
+    with pytest.raises(RuntimeError):
+        st.next_step()
+    assert (st.tick, st.sequence) == (0, 0)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import pytest
+
+from mmrl.core.events.base import Event
+from mmrl.core.events.bus import EventBus
+from mmrl.core.events.system import EngineTick, RunStarted, RunStopped
+
+
+def _events() -> list[Event]:
+    return [
+        RunStarted.create(run_id="r1", sequence=1),
+        EngineTick.create(run_id="r1", tick=1, sequence=2),
+        EngineTick.create(run_id="r1", tick=2, sequence=3),
+        RunStopped.create(run_id="r1", sequence=4),
+        EngineTick.create(run_id="r1", tick=3, sequence=5),
+    ]
+
+
+def _recording_bus(seen: list[tuple[str, int]]) -> EventBus:
+    bus = EventBus()
+    for event_type in ("system.run_started", "system.engine_tick"):
+        bus.subscribe(event_type=event_type, handler=lambda e, t=event_type: seen.append((t, e.sequence)))
+    # Second handler on the same type runs after the first
+    bus.subscribe(event_type="system.engine_tick", handler=lambda e: seen.append(("tick2", e.sequence)))
+    return bus
+
+
+def test_publish_many_matches_publish_per_event() -> None:
+    events = _events()
+
+    one_by_one: list[tuple[str, int]] = []
+    bus = _recording_bus(one_by_one)
+    for e in events:
+        bus.publish(e)
+
+    batched: list[tuple[str, int]] = []
+    _recording_bus(batched).publish_many(events)
+
+    assert batched == one_by_one
+    # Publish order and sequence numbers are preserved; unsubscribed types are skipped
+    assert batched == [
+        ("system.run_started", 1),
+        ("system.engine_tick", 2),
+        ("tick2", 2),
+        ("system.engine_tick", 3),
+        ("tick2", 3),
+        ("system.engine_tick", 5),
+        ("tick2", 5),
+    ]
+
+
+def test_publish_many_empty_batch_is_noop() -> None:
+    seen: list[tuple[str, int]] = []
+    _recording_bus(seen).publish_many([])
+    assert seen == []
+
+
+def test_subscribe_many_matches_subscribe_per_pair() -> None:
+    seen: list[tuple[str, int]] = []
+
+    def h1(e: Event) -> None:
+        seen.append(("h1", e.sequence))
+
+    def h2(e: Event) -> None:
+        seen.append(("h2", e.sequence))
+
+    pairs = [("system.engine_tick", h1), ("system.run_started", h2), ("system.engine_tick", h2)]
+
+    bus = EventBus()
+    subs = bus.subscribe_many(pairs)
+    assert [(s.event_type, s.handler) for s in subs] == pairs
+    assert bus.subscribers_for("system.engine_tick") == (h1, h2)
+    assert bus.subscribers_for("system.run_started") == (h2,)
+
+    bus.publish_many(_events())
+    batched = list(seen)
+
+    single = EventBus()
+    for event_type, handler in pairs:
+        single.subscribe(event_type=event_type, handler=handler)
+    seen.clear()
+    single.publish_many(_events())
+
+    assert batched == seen
+    assert batched[:3] == [("h2", 1), ("h1", 2), ("h2", 2)]
+
+
+def test_subscribe_many_rejects_empty_event_type() -> None:
+    with pytest.raises(ValueError):
+        EventBus().subscribe_many([("", lambda e: None)])
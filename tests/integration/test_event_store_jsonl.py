@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from uuid import UUID
+
+from mmrl.core.events.system import EngineTick, RunStarted
+from mmrl.storage.jsonl import JsonlEventStore
+
+
+def test_event_store_round_trip_keeps_line_format(tmp_path: Path) -> None:
+    events = [
+        RunStarted.create(run_id="r1", sequence=1),
+        EngineTick.create(run_id="r1", tick=1, sequence=2),
+        EngineTick.create(run_id="r1", tick=2, sequence=3),
+    ]
+
+    store = JsonlEventStore(path=tmp_path / "events.jsonl", fsync=False)
+    for e in events:
+        store.append(e)
+    store.close()
+
+    # Byte-identical to the original json.dumps(default=str) encoding,
+    # including the "YYYY-MM-DD HH:MM:SS.ffffff+00:00" timestamp format
+    expected = [
+        json.dumps({**asdict(e), "event_type": e.event_type}, sort_keys=True, separators=(",", ":"), default=str)
+        for e in events
+    ]
+    assert store.path.read_text(encoding="utf-8").splitlines() == expected
+
+    stored = list(JsonlEventStore(path=store.path, fsync=False).iter_events())
+    assert [d["event_type"] for d in stored] == [e.event_type for e in events]
+    for d, e in zip(stored, events):
+        assert UUID(d["event_id"]) == e.event_id
+        assert datetime.fromisoformat(d["timestamp_utc"]) == e.timestamp_utc
+        assert d["sequence"] == e.sequence
+
+
+def test_event_store_flushes_on_interval(tmp_path: Path) -> None:
+    store = JsonlEventStore(path=tmp_path / "events.jsonl", fsync=False, flush_interval_s=0.0)
+    store.append(EngineTick.create(run_id="r1", tick=1, sequence=1))
+
+    # Below buffer_bytes, but the interval has elapsed: already on disk
+    assert len(store.path.read_bytes().splitlines()) == 1
+    store.close()
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from mmrl.core.events.marketdata import BestBidAskUpdate
+from mmrl.execution.model.fill_model import (
+    FillDecision,
+    TopOfBookCappedFillModel,
+    TopOfBookFullFillModel,
+    decide_batch,
+)
+from mmrl.execution.oms.orders import OrderRecord
+
+
+def _orders() -> list[OrderRecord]:
+    out = []
+    i = 0
+    for side in ("buy", "sell"):
+        for price in (None, 99.0, 99.5, 100.0, 100.5, 101.0):
+            for qty in (0.1, 2.0):
+                i += 1
+                out.append(OrderRecord(symbol="X", order_id=f"o{i}", side=side, price=price, quantity=qty, remaining=qty))
+    filled = OrderRecord(symbol="X", order_id="done", side="buy", price=101.0, quantity=1.0, remaining=1.0)
+    filled.apply_fill(fill_qty=1.0)
+    out.append(filled)
+    return out
+
+
+def _bbos() -> list[BestBidAskUpdate]:
+    return [
+        BestBidAskUpdate.create(symbol="X", bid_price=b, bid_size=bs, ask_price=a, ask_size=asz, sequence=1)
+        for b, bs, a, asz in (
+            (99.5, 1.0, 100.5, 1.0),
+            (100.0, 0.5, 100.0, 3.0),
+            (99.0, 0.0, 101.0, 0.0),
+        )
+    ]
+
+
+def _per_item(model, orders, bbo) -> list[tuple[OrderRecord, FillDecision]]:
+    out = []
+    for o in orders:
+        d = model.decide(order=o, bbo=bbo)
+        if d.executable:
+            out.append((o, d))
+    return out
+
+
+def test_decide_batch_matches_per_order_decide() -> None:
+    orders = _orders()
+    for model in (TopOfBookFullFillModel(), TopOfBookCappedFillModel()):
+        for bbo in _bbos():
+            batched = decide_batch(model, orders=orders, bbo=bbo)
+            expected = _per_item(model, orders, bbo)
+            assert [(o.order_id, d) for o, d in batched] == [(o.order_id, d) for o, d in expected]
+
+
+def test_decide_batch_falls_back_to_decide() -> None:
+    class DecideOnly:
+        # No decide_batch: the module-level helper loops over decide()
+        def __init__(self) -> None:
+            self._inner = TopOfBookCappedFillModel()
+
+        def decide(self, *, order: OrderRecord, bbo: BestBidAskUpdate) -> FillDecision:
+            return self._inner.decide(order=order, bbo=bbo)
+
+    orders = _orders()
+    bbo = _bbos()[0]
+    batched = decide_batch(DecideOnly(), orders=iter(orders), bbo=bbo)
+    assert batched == _per_item(TopOfBookCappedFillModel(), orders, bbo)
+    assert batched  # the grid crosses the book
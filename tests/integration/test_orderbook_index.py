@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import random
+
+from mmrl.core.events.marketdata import OrderBookLevelUpdate
+from mmrl.marketdata.orderbook.book import OrderBook
+
+
+def _u(side: str, price: float, size: float, seq: int = 1) -> OrderBookLevelUpdate:
+    return OrderBookLevelUpdate.create(symbol="BTCUSDT", side=side, price=price, size=size, sequence=seq)
+
+
+def test_sorted_index_matches_reference_book() -> None:
+    rng = random.Random(7)
+    book = OrderBook(symbol="BTCUSDT")
+    ref: dict[str, dict[float, float]] = {"bid": {}, "ask": {}}
+
+    for seq in range(1, 2001):
+        side = rng.choice(("bid", "ask"))
+        price = 100.0 + rng.randrange(-40, 40) * 0.5
+        size = 0.0 if rng.random() < 0.35 else round(rng.uniform(0.1, 5.0), 3)
+        book.apply_level_update(_u(side, price, size, seq))
+        if size == 0.0:
+            ref[side].pop(price, None)
+        else:
+            ref[side][price] = size
+
+        bids = sorted(ref["bid"].items(), reverse=True)
+        asks = sorted(ref["ask"].items())
+        assert list(book.levels(side="bid")) == bids
+        assert list(book.levels(side="ask")) == asks
+        assert book.top_levels(side="bid", depth=5) == bids[:5]
+        assert book.top_levels(side="ask", depth=5) == asks[:5]
+
+        best = book.best()
+        assert (best.bid_price, best.bid_size) == (bids[0] if bids else (None, None))
+        assert (best.ask_price, best.ask_size) == (asks[0] if asks else (None, None))
+
+
+def test_top_changed_at_and_behind_top_of_book() -> None:
+    book = OrderBook(symbol="BTCUSDT")
+
+    # First level on each side is the new top
+    assert book.apply_level_update(_u("bid", 100.0, 1.0)) is True
+    assert book.apply_level_update(_u("ask", 101.0, 1.0)) is True
+
+    # Inserts behind the top
+    assert book.apply_level_update(_u("bid", 99.0, 1.0)) is False
+    assert book.apply_level_update(_u("ask", 102.0, 1.0)) is False
+    # Size change behind the top
+    assert book.apply_level_update(_u("bid", 99.0, 2.0)) is False
+    # Removals behind the top, and of a level that does not exist
+    assert book.apply_level_update(_u("ask", 102.0, 0.0)) is False
+    assert book.apply_level_update(_u("ask", 105.0, 0.0)) is False
+
+    # Size change at the top
+    assert book.apply_level_update(_u("bid", 100.0, 3.0)) is True
+    # Inserts that improve the top
+    assert book.apply_level_update(_u("bid", 100.5, 1.0)) is True
+    assert book.apply_level_update(_u("ask", 100.75, 1.0)) is True
+    # Removing the top exposes the next level
+    assert book.apply_level_update(_u("bid", 100.5, 0.0)) is True
+    assert book.best().bid_price == 100.0
+    assert book.apply_level_update(_u("ask", 100.75, 0.0)) is True
+    assert book.best().ask_price == 101.0
+    # Emptying a side
+    assert book.apply_level_update(_u("ask", 101.0, 0.0)) is True
+    assert book.best().ask_price is None
+
+
+def test_top_unchanged_means_best_unchanged() -> None:
+    rng = random.Random(11)
+    book = OrderBook(symbol="BTCUSDT")
+    for seq in range(1, 2001):
+        side = rng.choice(("bid", "ask"))
+        price = 100.0 + rng.randrange(-20, 20) * 0.5
+        size = 0.0 if rng.random() < 0.35 else round(rng.uniform(0.1, 5.0), 3)
+        before = book.best()
+        if not book.apply_level_update(_u(side, price, size, seq)):
+            assert book.best() == before
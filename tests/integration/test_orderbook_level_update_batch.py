@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import pytest
+
+from mmrl.core.events.marketdata import OrderBookLevelUpdate
+
+
+def test_create_many_matches_create_per_level() -> None:
+    prices = [100.0, 99.5, 99.0]
+    sizes = [1.0, 0.0, 2.5]
+
+    batch = OrderBookLevelUpdate.create_many(symbol="BTCUSDT", side="bid", prices=prices, sizes=sizes, first_sequence=7)
+    single = [
+        OrderBookLevelUpdate.create(symbol="BTCUSDT", side="bid", price=p, size=s, sequence=seq)
+        for seq, p, s in zip((7, 8, 9), prices, sizes)
+    ]
+
+    def view(u: OrderBookLevelUpdate) -> tuple:
+        return (u.event_type, u.symbol, u.side, u.price, u.size, u.sequence)
+
+    assert [view(u) for u in batch] == [view(u) for u in single]
+    # Input order, contiguous sequences, one timestamp and distinct ids per batch
+    assert [u.sequence for u in batch] == [7, 8, 9]
+    assert len({u.timestamp_utc for u in batch}) == 1
+    assert len({u.event_id for u in batch}) == 3
+
+
+def test_create_many_empty_and_mismatched_inputs() -> None:
+    assert OrderBookLevelUpdate.create_many(symbol="X", side="ask", prices=[], sizes=[], first_sequence=1) == []
+    with pytest.raises(ValueError):
+        OrderBookLevelUpdate.create_many(symbol="X", side="ask", prices=[1.0], sizes=[], first_sequence=1)
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from mmrl.marketdata.replay.jsonl_datasource import JsonlReplayDataSource
+
+
+def _write(path: Path, lines: list[dict]) -> Path:
+    path.write_text("\n\n".join(json.dumps(x) for x in lines) + "\n", encoding="utf-8")
+    return path
+
+
+def test_validate_false_yields_same_deltas_for_valid_file(tmp_path: Path) -> None:
+    path = _write(
+        tmp_path / "replay.jsonl",
+        [
+            {"symbol": "BTCUSDT", "bid_updates": [[43000, 1.0]], "ask_updates": [[43001, 2]]},
+            {"symbol": "BTCUSDT", "bid_updates": [[43000, 0]]},
+        ],
+    )
+
+    checked = list(JsonlReplayDataSource(path=path))
+    trusted = list(JsonlReplayDataSource(path=path, validate=False))
+    assert trusted == checked
+    assert len(trusted) == 2
+    assert trusted[0].ask_updates[0].size == 2.0
+
+
+def test_validate_false_skips_value_checks_only(tmp_path: Path) -> None:
+    bad_values = _write(tmp_path / "values.jsonl", [{"symbol": "BTCUSDT", "bid_updates": [[-1, 1.0]]}])
+    with pytest.raises(ValueError):
+        list(JsonlReplayDataSource(path=bad_values))
+    assert len(list(JsonlReplayDataSource(path=bad_values, validate=False))) == 1
+
+    # Structural checks always run
+    bad_symbol = _write(tmp_path / "symbol.jsonl", [{"bid_updates": [[1, 1.0]]}])
+    with pytest.raises(ValueError, match="symbol"):
+        list(JsonlReplayDataSource(path=bad_symbol, validate=False))
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from mmrl.core.run.artifacts import artifacts_for
+from mmrl.core.run.factory import RunFactory
+from mmrl.core.run.manager import RunManager
+from mmrl.core.run.spec import SPEC_HASH_KEY, RunSpec, construct_trusted, spec_digest
+
+
+def _config_on_disk(factory: RunFactory, run_id: str) -> dict:
+    art = artifacts_for(runs_dir=factory.runs_dir, run_id=run_id)
+    return json.loads(art.config_json.read_text(encoding="utf-8"))
+
+
+def test_build_persists_spec_mutated_after_previous_build(tmp_path: Path) -> None:
+    run = RunManager(tmp_path).create_run(seed=1, config_snapshot={"test": True})
+    factory = RunFactory(runs_dir=tmp_path)
+
+    spec = factory.load_spec(run_id=run.run_id)
+    factory.build(run_id=run.run_id, spec=spec)
+
+    # Nested in-place edit: does not reset the memoized config_hash()
+    spec.strategy.fixed_spread.spread = 7.5
+    factory.build(run_id=run.run_id, spec=spec)
+
+    on_disk = _config_on_disk(factory, run.run_id)
+    assert on_disk["strategy"]["fixed_spread"]["spread"] == 7.5
+    stored_hash = on_disk.pop(SPEC_HASH_KEY)
+    assert stored_hash == spec_digest(on_disk)
+
+    # Top-level reassignment is persisted too
+    spec.symbol = "ETHUSDT"
+    factory.build(run_id=run.run_id, spec=spec)
+    assert _config_on_disk(factory, run.run_id)["symbol"] == "ETHUSDT"
+
+    reloaded = factory.load_spec(run_id=run.run_id)
+    assert reloaded.symbol == "ETHUSDT"
+    assert reloaded.strategy.fixed_spread.spread == 7.5
+
+
+def test_load_spec_returns_independent_copies(tmp_path: Path) -> None:
+    run = RunManager(tmp_path).create_run(seed=1, config_snapshot={"test": True})
+    factory = RunFactory(runs_dir=tmp_path)
+    factory.save_spec(run_id=run.run_id, spec=factory.load_spec(run_id=run.run_id))
+
+    first = factory.load_spec(run_id=run.run_id)
+    first.strategy.fixed_spread.spread = 99.0
+    first.tags["mutated"] = "yes"
+
+    second = factory.load_spec(run_id=run.run_id)
+    assert second.strategy.fixed_spread.spread != 99.0
+    assert "mutated" not in second.tags
+
+
+def test_construct_trusted_matches_validated_spec() -> None:
+    specs = [
+        RunSpec(),
+        RunSpec.model_validate(
+            {
+                "symbol": "ETHUSDT",
+                "seed": 7,
+                "tags": {"a": "b"},
+                "marketdata": {"mode": "paper_replay_l2", "replay_l2": {"path": "/tmp/r.jsonl", "format": "jsonl"}},
+                "strategy": {"fixed_spread": {"spread": 2.0, "order_size": 0.5, "max_inventory": 3.0}},
+            }
+        ),
+    ]
+    for spec in specs:
+        payload = spec.to_canonical_dict()
+        trusted = construct_trusted(spec.to_canonical_dict(), spec_digest(payload))
+        validated = RunSpec.model_validate(payload)
+
+        assert trusted.model_dump() == validated.model_dump()
+        assert trusted.to_canonical_dict() == payload
+        assert trusted.config_hash() == validated.config_hash() == spec.config_hash()
+
+
+def test_load_spec_revalidates_edited_config(tmp_path: Path) -> None:
+    run = RunManager(tmp_path).create_run(seed=1, config_snapshot={"test": True})
+    factory = RunFactory(runs_dir=tmp_path)
+    factory.save_spec(run_id=run.run_id, spec=RunSpec())
+
+    # Hand edit: content no longer matches the stored hash, so it is validated
+    art = artifacts_for(runs_dir=tmp_path, run_id=run.run_id)
+    data = json.loads(art.config_json.read_text(encoding="utf-8"))
+    data["strategy"]["fixed_spread"]["spread"] = -1.0
+    art.config_json.write_text(json.dumps(data), encoding="utf-8")
+
+    with pytest.raises(ValidationError):
+        factory.load_spec(run_id=run.run_id)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from mmrl.app.main import create_app
+from mmrl.core.config.settings import settings
+from mmrl.core.run.manager import RunManager
+
+
+@pytest.fixture()
+def client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    monkeypatch.setattr(settings, "runs_dir", tmp_path)
+    return TestClient(create_app())
+
+
+def test_batch_get_returns_per_item_results(client: TestClient) -> None:
+    run_id = client.post("/api/runs", json={}).json()["run_id"]
+
+    resp = client.post("/api/runs:batchGet", json={"run_ids": [run_id, "missing_run", "bad/id"]})
+    assert resp.status_code == 200
+
+    results = resp.json()["results"]
+    assert [r["run_id"] for r in results] == [run_id, "missing_run", "bad/id"]
+
+    ok, missing, invalid = results
+    assert ok["ok"] is True
+    assert ok["data"] == client.get(f"/api/runs/{run_id}").json()
+
+    assert missing["ok"] is False and missing["error"] == "run not found"
+    assert invalid["ok"] is False and "invalid run_id" in invalid["error"]
+
+
+def test_batch_get_rejects_oversized_batch(client: TestClient) -> None:
+    resp = client.post("/api/runs:batchGet", json={"run_ids": [f"r{i}" for i in range(101)]})
+    assert resp.status_code == 422
+
+
+def test_unregistered_run_disappears_once_its_directory_is_deleted(client: TestClient, tmp_path: Path) -> None:
+    # Created on disk only (e.g. by another process): served from the disk fallback
+    run = RunManager(tmp_path).create_run(seed=1, config_snapshot={"test": True})
+
+    resp = client.get(f"/api/runs/{run.run_id}")
+    assert resp.status_code == 200
+    assert resp.json()["status"] == "created"
+
+    shutil.rmtree(run.run_dir)
+
+    assert client.get(f"/api/runs/{run.run_id}").status_code == 404
+    results = client.post("/api/runs:batchGet", json={"run_ids": [run.run_id]}).json()["results"]
+    assert results[0]["ok"] is False and results[0]["error"] == "run not found"
+
+
+def test_list_and_get_agree_on_run_dir_after_runs_dir_change(
+    client: TestClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    for runs_dir in (tmp_path, tmp_path / "moved"):
+        runs_dir.mkdir(exist_ok=True)
+        monkeypatch.setattr(settings, "runs_dir", runs_dir)
+        run_id = client.post("/api/runs", json={}).json()["run_id"]
+
+        listed = {r["run_id"]: r for r in client.get("/api/runs").json()["runs"]}[run_id]
+        fetched = client.get(f"/api/runs/{run_id}").json()
+        assert listed["run_dir"] == fetched["run_dir"] == str((runs_dir / run_id).resolve())